@@ -103,8 +103,9 @@ hiddenimports = [
     'ui.components.result_card',
     'ui.components.file_list_widget',
 
-    # i18n
+    # i18n and settings
     'i18n',
+    'app_settings',
 
     # Workers
     'workers',
@@ -0,0 +1,63 @@
+"""Shared application settings with an in-memory read cache.
+
+Every QSettings construction reads and parses the backing store (an INI
+file, or the registry on Windows), so the app keeps a single instance.
+Values are read once into a dict; writes go through to QSettings, which
+persists them lazily, and sync() is called when the application quits.
+"""
+
+from typing import Any, Dict, Optional
+
+from PyQt6.QtCore import QSettings
+
+ORGANIZATION = "Svetozar Technologies"
+APPLICATION = "LocalPDF"
+
+_settings: Optional[QSettings] = None
+_values: Dict[str, Any] = {}
+
+
+def get_settings() -> QSettings:
+    """Return the shared QSettings, loading all values on first use."""
+    global _settings
+    if _settings is None:
+        _settings = QSettings(ORGANIZATION, APPLICATION)
+        _values.update((key, _settings.value(key)) for key in _settings.allKeys())
+    return _settings
+
+
+def value(key: str, default: Any = None, type: Optional[type] = None) -> Any:
+    """Read a cached value. `type` converts stored strings (e.g. int, float)."""
+    get_settings()
+    v = _values.get(key)
+    if v is None or v == "":
+        return default
+    if type is not None:
+        try:
+            return type(v)
+        except (TypeError, ValueError):
+            return default
+    return v
+
+
+def set_value(key: str, v: Any):
+    """Store a value; unchanged values are not written again."""
+    settings = get_settings()
+    if key in _values and _values[key] == v:
+        return
+    _values[key] = v
+    settings.setValue(key, v)
+
+
+def remove(*keys: str):
+    settings = get_settings()
+    for key in keys:
+        if key in _values:
+            del _values[key]
+            settings.remove(key)
+
+
+def sync():
+    """Flush pending writes (connected to QApplication.aboutToQuit)."""
+    if _settings is not None:
+        _settings.sync()
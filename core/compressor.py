@@ -48,6 +48,24 @@ class CompressionConfig:
 ProgressCallback = Callable[[int, int, str], None]
 CancelCheck = Callable[[], bool]
 
+# Batch-wide cancel flag, handed to each process by init_compress_process
+_process_cancel_event = None
+
+
+def init_compress_process(cancel_event):
+    """Pool initializer for batch compression processes.
+
+    cancel_event is a multiprocessing Event shared by the whole batch;
+    setting it stops the file each process is working on.
+    """
+    global _process_cancel_event
+    _process_cancel_event = cancel_event
+
+
+def compress_in_process(config: CompressionConfig) -> CompressionResult:
+    """Compress one file in a process started with init_compress_process."""
+    return PDFCompressor().compress(config, is_cancelled=_process_cancel_event.is_set)
+
 
 class PDFCompressor:
     """Main PDF compression engine."""
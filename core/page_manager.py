@@ -3,6 +3,10 @@
 import copy
 import io
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import wait
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Callable, Dict, List, Optional, Tuple
@@ -10,6 +14,8 @@ from typing import Callable, Dict, List, Optional, Tuple
 import fitz  # PyMuPDF
 from PIL import Image
 
+from core.utils import default_process_count, process_pool
+
 
 # ---------------------------------------------------------------------------
 # Data model
@@ -62,6 +68,46 @@ class PageManagerResult:
 ProgressCallback = Callable[[int, int, str], None]
 CancelCheck = Callable[[], bool]
 
+# Recent full-page renders, before annotations are composited, keyed by
+# (path, mtime_ns, size, page index, rotation, max_width). The annotation
+# dialogs each render the page they open on, and users typically open
+# several of them in a row on the same page.
+_PAGE_RENDER_CACHE_SIZE = 8
+_page_render_cache: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+_page_render_lock = threading.Lock()
+
+# Thumbnails are rendered on the calling thread first. If the first
+# THUMBNAIL_SAMPLE_PAGES show that the rest would take longer than
+# THUMBNAIL_PROCESS_THRESHOLD_SECONDS (scanned documents, mostly), the
+# remaining pages go to render processes; starting those costs about half
+# a second, more than most text documents take in total.
+THUMBNAIL_SAMPLE_PAGES = 8
+THUMBNAIL_PROCESS_THRESHOLD_SECONDS = 2.0
+# Pages per render-process task: small enough that thumbnails keep arriving
+# steadily and a cancel waits for little, large enough to amortize the IPC
+THUMBNAIL_PAGES_PER_TASK = 8
+
+# Document opened once per render process by _init_thumbnail_process
+_thumbnail_doc: Optional[fitz.Document] = None
+
+
+def _render_thumbnail(page: fitz.Page, thumb_width: int) -> Image.Image:
+    # Calculate zoom to fit thumb_width
+    zoom = thumb_width / page.rect.width
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csRGB, alpha=False)
+    return Image.frombytes("RGB", (pix.width, pix.height), pix.samples_mv)
+
+
+def _init_thumbnail_process(pdf_path: str):
+    """Pool initializer: open the PDF once for the lifetime of the process."""
+    global _thumbnail_doc
+    _thumbnail_doc = fitz.open(pdf_path)
+
+
+def _render_thumbnail_task(page_indices: List[int], thumb_width: int) -> List[Image.Image]:
+    """Render a batch of thumbnails in a render process."""
+    return [_render_thumbnail(_thumbnail_doc[i], thumb_width) for i in page_indices]
+
 
 class PageManager:
     """Render thumbnails and apply page operations (reorder, rotate, delete, insert, annotate)."""
@@ -72,33 +118,40 @@ class PageManager:
         thumb_width: int = 150,
         on_thumbnail: Optional[Callable[[int, Image.Image], None]] = None,
         is_cancelled: Optional[CancelCheck] = None,
+        workers: Optional[int] = None,
     ) -> List[Image.Image]:
         """Render page thumbnails from a PDF.
 
         Args:
             pdf_path: Path to the PDF file.
             thumb_width: Width of each thumbnail in pixels.
-            on_thumbnail: Callback (page_index, image) fired after each page renders.
+            on_thumbnail: Callback (page_index, image) fired after each page
+                renders, always in page order.
             is_cancelled: Callable returning True to abort early.
+            workers: Render processes to use for slow documents. None or 0 =
+                one per CPU core, less one kept free for the UI; 1 renders
+                everything on the calling thread.
 
         Returns:
             List of PIL Images (one per page).
         """
         doc = fitz.open(pdf_path)
         thumbnails: List[Image.Image] = []
+        num_processes = workers or default_process_count()
 
         try:
-            for i in range(len(doc)):
+            total = len(doc)
+            start = time.monotonic()
+            for i in range(total):
                 if is_cancelled and is_cancelled():
-                    break
+                    return thumbnails
 
-                page = doc[i]
-                # Calculate zoom to fit thumb_width
-                zoom = thumb_width / page.rect.width
-                mat = fitz.Matrix(zoom, zoom)
-                pix = page.get_pixmap(matrix=mat, alpha=False)
+                if i == THUMBNAIL_SAMPLE_PAGES and num_processes > 1:
+                    per_page = (time.monotonic() - start) / i
+                    if per_page * (total - i) > THUMBNAIL_PROCESS_THRESHOLD_SECONDS:
+                        break
 
-                img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+                img = _render_thumbnail(doc[i], thumb_width)
                 thumbnails.append(img)
 
                 if on_thumbnail:
@@ -106,8 +159,66 @@ class PageManager:
         finally:
             doc.close()
 
+        if len(thumbnails) < total:
+            self._render_thumbnails_in_processes(
+                pdf_path, len(thumbnails), total, thumb_width, num_processes,
+                thumbnails, on_thumbnail, is_cancelled,
+            )
         return thumbnails
 
+    @staticmethod
+    def page_sizes(pdf_path: str) -> List[Tuple[float, float]]:
+        """Return the (width, height) of every page in points, in page order."""
+        doc = fitz.open(pdf_path)
+        try:
+            return [(page.rect.width, page.rect.height) for page in doc]
+        finally:
+            doc.close()
+
+    @staticmethod
+    def _render_thumbnails_in_processes(
+        pdf_path: str,
+        first: int,
+        total: int,
+        thumb_width: int,
+        num_processes: int,
+        thumbnails: List[Image.Image],
+        on_thumbnail: Optional[Callable[[int, Image.Image], None]],
+        is_cancelled: Optional[CancelCheck],
+    ):
+        """Render pages first..total-1 in render processes, appending in order.
+
+        MuPDF rendering holds the GIL, so threads cannot overlap it. Batches
+        complete out of order but are handed on in page order, which is how
+        the page grid lays them out.
+        """
+        batches = [
+            list(range(start, min(start + THUMBNAIL_PAGES_PER_TASK, total)))
+            for start in range(first, total, THUMBNAIL_PAGES_PER_TASK)
+        ]
+        executor = process_pool(
+            min(num_processes, len(batches)), _init_thumbnail_process, (pdf_path,),
+        )
+        cancelled = False
+        try:
+            futures = [
+                executor.submit(_render_thumbnail_task, batch, thumb_width)
+                for batch in batches
+            ]
+            for batch, future in zip(batches, futures):
+                while not wait([future], timeout=0.1).done:
+                    if is_cancelled and is_cancelled():
+                        cancelled = True
+                        return
+                for i, img in zip(batch, future.result()):
+                    thumbnails.append(img)
+                    if on_thumbnail:
+                        on_thumbnail(i, img)
+        finally:
+            # On cancel, don't wait for the batches still rendering: the
+            # caller is usually tearing down or loading another file
+            executor.shutdown(wait=not cancelled, cancel_futures=True)
+
     def apply_operations(
         self,
         pdf_path: str,
@@ -196,11 +307,7 @@ class PageManager:
         # ORIGINAL or EXTERNAL — render from PDF
         doc = fitz.open(source.source_path)
         try:
-            page = doc[source.source_page_index]
-            zoom = thumb_width / page.rect.width
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat, alpha=False)
-            return Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+            return _render_thumbnail(doc[source.source_page_index], thumb_width)
         finally:
             doc.close()
 
@@ -213,23 +320,51 @@ class PageManager:
             h = int(max_width * aspect)
             img = Image.new("RGB", (max_width, h), (255, 255, 255))
         else:
-            doc = fitz.open(source.source_path)
-            try:
-                page = doc[source.source_page_index]
-                zoom = max_width / page.rect.width
-                mat = fitz.Matrix(zoom, zoom)
-                if source.rotation:
-                    mat = mat.prerotate(source.rotation)
-                pix = page.get_pixmap(matrix=mat, alpha=False)
-                img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
-            finally:
-                doc.close()
+            img = self._render_page(source, max_width)
 
         # Composite annotations onto the rendered image
         if source.text_annotations or source.image_annotations:
             img = self._composite_annotations(img, source)
         return img
 
+    @staticmethod
+    def _render_page(source: PageSource, max_width: int) -> Image.Image:
+        """Render a PDF page, reusing a recent render of the unchanged file."""
+        try:
+            st = os.stat(source.source_path)
+            key = (source.source_path, st.st_mtime_ns, st.st_size,
+                   source.source_page_index, source.rotation, max_width)
+        except OSError:
+            key = None  # Let fitz.open report the error
+
+        if key is not None:
+            with _page_render_lock:
+                cached = _page_render_cache.get(key)
+                if cached is not None:
+                    _page_render_cache.move_to_end(key)
+                    # Callers draw annotations onto the returned image
+                    return cached.copy()
+
+        doc = fitz.open(source.source_path)
+        try:
+            page = doc[source.source_page_index]
+            zoom = max_width / page.rect.width
+            mat = fitz.Matrix(zoom, zoom)
+            if source.rotation:
+                mat = mat.prerotate(source.rotation)
+            pix = page.get_pixmap(matrix=mat, alpha=False)
+            img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+        finally:
+            doc.close()
+
+        if key is not None:
+            with _page_render_lock:
+                _page_render_cache[key] = img
+                while len(_page_render_cache) > _PAGE_RENDER_CACHE_SIZE:
+                    _page_render_cache.popitem(last=False)
+            return img.copy()
+        return img
+
     def _composite_annotations(
         self, img: Image.Image, source: PageSource,
     ) -> Image.Image:
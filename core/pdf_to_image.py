@@ -1,12 +1,18 @@
 """PDF to Image Converter Engine."""
 
+import io
 import os
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, wait
 import fitz
 from PIL import Image
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Callable, Optional, List
 
+from core.utils import default_process_count, process_pool
+
 
 class ImageFormat(Enum):
     PNG = "png"
@@ -25,6 +31,49 @@ class PDFToImageResult:
 ProgressCallback = Callable[[int, int, str], None]
 CancelCheck = Callable[[], bool]
 
+# Below this many pages the cost of starting render processes outweighs the gain
+MIN_PAGES_FOR_PROCESSES = 8
+# Pages handed to a render process per task; small enough for steady progress
+# updates and prompt cancellation, large enough to amortize the IPC round trip
+PAGES_PER_TASK = 4
+# Output file buffer: PIL encodes in 64 KB blocks, this coalesces them into
+# large writes so a high-DPI page costs a few syscalls instead of hundreds
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Document opened once per render process by _init_render_process
+_process_doc: Optional[fitz.Document] = None
+
+
+def _init_render_process(input_path: str):
+    """Pool initializer: open the PDF once for the lifetime of the process."""
+    global _process_doc
+    _process_doc = fitz.open(input_path)
+
+
+def _render_task(jobs, zoom: float, image_format: "ImageFormat", jpeg_quality: int):
+    """Render and save a batch of (index, page_num, out_path) jobs in a render process.
+
+    The batch is encoded first and written afterwards: each raster is freed
+    as soon as it is encoded, and the files then go out back to back with a
+    single write() apiece.
+    """
+    mat = fitz.Matrix(zoom, zoom)
+    encoded = []
+    for index, page_num, out_path in jobs:
+        pix = _process_doc[page_num].get_pixmap(matrix=mat, colorspace=fitz.csRGB, alpha=False)
+        pil_img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples_mv)
+        del pix
+        encoded.append((index, out_path, PDFToImageConverter._encode_image(
+            pil_img, image_format, jpeg_quality)))
+        del pil_img
+
+    done = []
+    for index, out_path, data in encoded:
+        with open(out_path, "wb", buffering=0) as f:
+            f.write(data)
+        done.append((index, out_path))
+    return done
+
 
 class PDFToImageConverter:
     """Converts PDF pages to images (PNG or JPEG)."""
@@ -37,6 +86,7 @@ class PDFToImageConverter:
         image_format: ImageFormat = ImageFormat.PNG,
         dpi: int = 300,
         jpeg_quality: int = 90,
+        workers: Optional[int] = None,
         on_progress: Optional[ProgressCallback] = None,
         is_cancelled: Optional[CancelCheck] = None,
     ) -> PDFToImageResult:
@@ -50,6 +100,9 @@ class PDFToImageConverter:
             image_format: PNG or JPEG.
             dpi: Resolution (72, 150, 300, 600).
             jpeg_quality: JPEG quality (1-100), only used for JPEG format.
+            workers: Render processes to use. None or 0 = one per CPU core,
+                less one kept free for the UI; 1 renders everything on the
+                calling thread.
             on_progress: Progress callback.
             is_cancelled: Cancellation check.
         """
@@ -90,50 +143,201 @@ class PDFToImageConverter:
         base_name = os.path.splitext(os.path.basename(input_path))[0]
         ext = "png" if image_format == ImageFormat.PNG else "jpg"
         zoom = dpi / 72
-        mat = fitz.Matrix(zoom, zoom)
 
-        output_paths = []
+        # Join the directory once; each page only appends its zero-padded
+        # number (e.g. report_page_007.png)
+        path_prefix = os.path.join(output_dir, f"{base_name}_page_")
+        jobs = [
+            (i, page_num, f"{path_prefix}{page_num + 1:0{pad_width}d}.{ext}")
+            for i, page_num in enumerate(page_numbers)
+        ]
+
+        # Leave a core for the UI thread unless the caller asked otherwise
+        num_processes = min(workers or default_process_count(), total)
+        if num_processes > 1 and total >= MIN_PAGES_FOR_PROCESSES:
+            # Each render process opens its own copy of the document
+            doc.close()
+            return self._convert_in_processes(
+                input_path, output_dir, jobs, num_processes, zoom,
+                image_format, jpeg_quality, on_progress, is_cancelled,
+            )
+
+        return self._convert_in_thread(
+            doc, output_dir, jobs, zoom, image_format, jpeg_quality,
+            on_progress, is_cancelled,
+        )
+
+    def _convert_in_processes(
+        self,
+        input_path: str,
+        output_dir: str,
+        jobs: list,
+        num_processes: int,
+        zoom: float,
+        image_format: ImageFormat,
+        jpeg_quality: int,
+        on_progress: Optional[ProgressCallback],
+        is_cancelled: Optional[CancelCheck],
+    ) -> PDFToImageResult:
+        """Render pages in a pool of processes, each with its own open document.
+
+        MuPDF rendering holds the GIL, so threads cannot overlap it; separate
+        processes scale with the number of cores. Each process renders, encodes
+        and writes its pages directly, so only (index, path) pairs come back.
+        """
+        total = len(jobs)
+        output_paths: List[Optional[str]] = [None] * total
+        completed = 0
 
+        executor = process_pool(num_processes, _init_render_process, (input_path,))
         try:
-            for i, page_num in enumerate(page_numbers):
+            pending = {
+                executor.submit(
+                    _render_task, jobs[start:start + PAGES_PER_TASK],
+                    zoom, image_format, jpeg_quality,
+                )
+                for start in range(0, total, PAGES_PER_TASK)
+            }
+            self._report(on_progress, 0, total,
+                         f"Exporting {total} pages on {num_processes} processes...")
+
+            while pending:
                 if is_cancelled and is_cancelled():
-                    doc.close()
+                    executor.shutdown(wait=True, cancel_futures=True)
                     return PDFToImageResult(success=False, error_message="Cancelled.")
 
-                page_label = str(page_num + 1).zfill(pad_width)
-                out_name = f"{base_name}_page_{page_label}.{ext}"
-                out_path = os.path.join(output_dir, out_name)
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for index, out_path in future.result():
+                        output_paths[index] = out_path
+                        completed += 1
+                if done:
+                    self._report(on_progress, completed, total,
+                                 f"Exported {completed}/{total} pages...")
+        except Exception as e:
+            executor.shutdown(wait=True, cancel_futures=True)
+            return PDFToImageResult(success=False, error_message=f"Export failed: {e}")
+
+        executor.shutdown(wait=True)
+        self._report(on_progress, total, total, "Done!")
+
+        return PDFToImageResult(
+            success=True,
+            output_dir=output_dir,
+            output_paths=output_paths,
+            pages_exported=len(output_paths),
+        )
+
+    def _convert_in_thread(
+        self,
+        doc: fitz.Document,
+        output_dir: str,
+        jobs: list,
+        zoom: float,
+        image_format: ImageFormat,
+        jpeg_quality: int,
+        on_progress: Optional[ProgressCallback],
+        is_cancelled: Optional[CancelCheck],
+    ) -> PDFToImageResult:
+        """Render pages on the calling thread, handing encoding to writer threads."""
+        total = len(jobs)
+        mat = fitz.Matrix(zoom, zoom)
+
+        # Rendering stays on this thread (a fitz.Document must not be shared
+        # across threads); encoding and writing run on a few writer threads fed
+        # through a bounded queue, so at most a handful of rendered pages are
+        # held in memory no matter how long the document is.
+        num_writers = max(1, min(os.cpu_count() or 1, total))
+        pending = queue.Queue(maxsize=2 * num_writers)
+        output_paths: List[Optional[str]] = [None] * total
+        write_errors: List[Exception] = []
+        stop = threading.Event()
+
+        def write_pages():
+            while True:
+                item = pending.get()
+                if item is None:
+                    return
+                if stop.is_set():
+                    continue  # Keep draining so the producer never blocks
+                index, pil_img, out_path = item
+                try:
+                    self._save_image(pil_img, out_path, image_format, jpeg_quality)
+                    output_paths[index] = out_path
+                except Exception as e:
+                    write_errors.append(e)
+                    stop.set()
+
+        writers = [threading.Thread(target=write_pages, daemon=True) for _ in range(num_writers)]
+        for writer in writers:
+            writer.start()
+
+        cancelled = False
+        try:
+            for i, page_num, out_path in jobs:
+                if stop.is_set():
+                    break
+                if is_cancelled and is_cancelled():
+                    cancelled = True
+                    stop.set()
+                    break
 
                 self._report(on_progress, i, total,
                              f"Exporting page {page_num + 1} ({i + 1}/{total})...")
 
+                # Render straight to 3-byte RGB: no alpha plane to allocate or
+                # strip, and the samples match the "RGB" raw layout below
                 page = doc[page_num]
-                pix = page.get_pixmap(matrix=mat)
+                pix = page.get_pixmap(matrix=mat, colorspace=fitz.csRGB, alpha=False)
 
-                # Convert to PIL Image for consistent saving
-                pil_img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+                # Convert to PIL Image for consistent saving. samples_mv is a
+                # view of MuPDF's buffer, so the raster is copied once (into
+                # PIL) rather than first into an intermediate bytes object;
+                # at 600 DPI that is ~100 MB and ~0.1 s per page saved.
+                pil_img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples_mv)
+                del pix
 
-                if image_format == ImageFormat.JPEG:
-                    pil_img.save(out_path, format="JPEG", quality=jpeg_quality, optimize=True)
-                else:
-                    pil_img.save(out_path, format="PNG", optimize=True)
+                pending.put((i, pil_img, out_path))
+        except Exception as e:
+            write_errors.append(e)
+            stop.set()
+        finally:
+            for _ in writers:
+                pending.put(None)
+            for writer in writers:
+                writer.join()
+            doc.close()
 
-                output_paths.append(out_path)
+        if cancelled:
+            return PDFToImageResult(success=False, error_message="Cancelled.")
+        if write_errors:
+            return PDFToImageResult(success=False, error_message=f"Export failed: {write_errors[0]}")
 
-            doc.close()
+        self._report(on_progress, total, total, "Done!")
 
-            self._report(on_progress, total, total, "Done!")
+        return PDFToImageResult(
+            success=True,
+            output_dir=output_dir,
+            output_paths=output_paths,
+            pages_exported=len(output_paths),
+        )
 
-            return PDFToImageResult(
-                success=True,
-                output_dir=output_dir,
-                output_paths=output_paths,
-                pages_exported=len(output_paths),
-            )
+    @staticmethod
+    def _save_image(pil_img: Image.Image, out_path: str, image_format: ImageFormat, jpeg_quality: int):
+        with open(out_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            if image_format == ImageFormat.JPEG:
+                pil_img.save(f, format="JPEG", quality=jpeg_quality, optimize=True)
+            else:
+                pil_img.save(f, format="PNG", optimize=True)
 
-        except Exception as e:
-            doc.close()
-            return PDFToImageResult(success=False, error_message=f"Export failed: {e}")
+    @staticmethod
+    def _encode_image(pil_img: Image.Image, image_format: ImageFormat, jpeg_quality: int) -> memoryview:
+        buf = io.BytesIO()
+        if image_format == ImageFormat.JPEG:
+            pil_img.save(buf, format="JPEG", quality=jpeg_quality, optimize=True)
+        else:
+            pil_img.save(buf, format="PNG", optimize=True)
+        return buf.getbuffer()
 
     @staticmethod
     def _report(cb: Optional[ProgressCallback], step: int, total: int, msg: str):
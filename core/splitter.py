@@ -1,9 +1,11 @@
 """PDF Split / Extract Pages Engine."""
 
 import os
+import re
+import functools
 import fitz
 from dataclasses import dataclass, field
-from typing import Callable, Optional, List
+from typing import Callable, Optional, List, Tuple
 from pathlib import Path
 
 
@@ -20,6 +22,10 @@ ProgressCallback = Callable[[int, int, str], None]
 CancelCheck = Callable[[], bool]
 
 
+# One comma-separated part of a page range: "7" or "3-12" (blanks allowed)
+_RANGE_PART_RE = re.compile(r"\s*\+?(\d+)\s*(?:-\s*\+?(\d+)\s*)?")
+
+
 class PageRangeParser:
     """Parses page range strings like '1-5', '3,7,10-15', '1,3-5,8'."""
 
@@ -32,49 +38,49 @@ class PageRangeParser:
         """
         if not range_str or not range_str.strip():
             raise ValueError("Page range cannot be empty.")
+        return list(PageRangeParser._parse_cached(range_str, max_page))
 
-        pages = set()
-        parts = range_str.split(",")
-
-        for part in parts:
-            part = part.strip()
-            if not part:
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _parse_cached(range_str: str, max_page: int) -> Tuple[int, ...]:
+        # Collect (start, end) intervals and merge them, so '1-10000' costs one
+        # range() expansion instead of ten thousand set insertions plus a sort.
+        intervals = []
+        for part in range_str.split(","):
+            if not part.strip():
                 continue
 
-            if "-" in part:
-                bounds = part.split("-", 1)
-                if len(bounds) != 2:
-                    raise ValueError(f"Invalid range: '{part}'")
-                try:
-                    start = int(bounds[0].strip())
-                    end = int(bounds[1].strip())
-                except ValueError:
+            match = _RANGE_PART_RE.fullmatch(part)
+            if not match:
+                part = part.strip()
+                if "-" in part:
                     raise ValueError(f"Non-numeric value in range: '{part}'")
+                raise ValueError(f"Non-numeric page number: '{part}'")
+
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) is not None else start
+
+            if start > end:
+                raise ValueError(f"Invalid range '{part.strip()}': start ({start}) > end ({end}).")
+            if start < 1:
+                raise ValueError(f"Page number must be at least 1, got {start}.")
+            if end > max_page:
+                raise ValueError(f"Page {end} exceeds document length ({max_page} pages).")
+
+            intervals.append((start - 1, end))  # 0-indexed, end exclusive
 
-                if start > end:
-                    raise ValueError(f"Invalid range '{part}': start ({start}) > end ({end}).")
-                if start < 1:
-                    raise ValueError(f"Page number must be at least 1, got {start}.")
-                if end > max_page:
-                    raise ValueError(f"Page {end} exceeds document length ({max_page} pages).")
-
-                for p in range(start, end + 1):
-                    pages.add(p - 1)  # Convert to 0-indexed
-            else:
-                try:
-                    p = int(part)
-                except ValueError:
-                    raise ValueError(f"Non-numeric page number: '{part}'")
-                if p < 1:
-                    raise ValueError(f"Page number must be at least 1, got {p}.")
-                if p > max_page:
-                    raise ValueError(f"Page {p} exceeds document length ({max_page} pages).")
-                pages.add(p - 1)  # Convert to 0-indexed
-
-        if not pages:
+        if not intervals:
             raise ValueError("No valid pages specified.")
 
-        return sorted(pages)
+        intervals.sort()
+        pages: List[int] = []
+        covered = 0  # Pages below this index are already in the result
+        for start, end in intervals:
+            start = max(start, covered)
+            if start < end:
+                pages.extend(range(start, end))
+                covered = end
+        return tuple(pages)
 
 
 class PDFSplitter:
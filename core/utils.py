@@ -5,10 +5,15 @@ import sys
 import shutil
 import platform
 import subprocess
+import threading
+import time
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 
 class FileType(Enum):
@@ -35,6 +40,16 @@ class LibreOfficeInfo:
     install_instructions: str = ""
 
 
+# Results of opening recently validated PDFs, keyed by (path, mtime_ns, size).
+# The same file is often dropped into several tabs in a row; each of them
+# would otherwise parse it again. Documents themselves are not kept open:
+# a fitz.Document must not be shared across threads, and an open handle
+# would lock the file on Windows.
+_PDF_VALIDATION_CACHE_SIZE = 32
+_pdf_validation_cache: "OrderedDict[Tuple[str, int, int], ValidationResult]" = OrderedDict()
+_pdf_validation_lock = threading.Lock()
+
+
 def validate_pdf(file_path: str) -> ValidationResult:
     """Validate a PDF file for compression."""
     from i18n import t
@@ -42,17 +57,26 @@ def validate_pdf(file_path: str) -> ValidationResult:
     if not file_path:
         return ValidationResult(False, t("validate.no_file"))
 
-    if not os.path.exists(file_path):
+    try:
+        st = os.stat(file_path)
+    except OSError:
         return ValidationResult(False, t("validate.file_not_found", name=os.path.basename(file_path)))
 
     ext = Path(file_path).suffix.lower()
     if ext != ".pdf":
         return ValidationResult(False, t("validate.wrong_ext_pdf", ext=ext))
 
-    file_size = os.path.getsize(file_path)
+    file_size = st.st_size
     if file_size == 0:
         return ValidationResult(False, t("validate.empty_file"))
 
+    key = (file_path, st.st_mtime_ns, file_size)
+    with _pdf_validation_lock:
+        cached = _pdf_validation_cache.get(key)
+        if cached is not None:
+            _pdf_validation_cache.move_to_end(key)
+            return replace(cached)
+
     try:
         import fitz
         doc = fitz.open(file_path)
@@ -61,26 +85,32 @@ def validate_pdf(file_path: str) -> ValidationResult:
 
     if doc.is_encrypted:
         doc.close()
-        return ValidationResult(
+        result = ValidationResult(
             False,
             t("validate.encrypted"),
             file_size_bytes=file_size,
             file_type=FileType.PDF,
             is_encrypted=True,
         )
+    else:
+        page_count = len(doc)
+        doc.close()
 
-    page_count = len(doc)
-    doc.close()
+        if page_count == 0:
+            result = ValidationResult(False, t("validate.no_pages"), file_size_bytes=file_size, file_type=FileType.PDF)
+        else:
+            result = ValidationResult(
+                valid=True,
+                file_size_bytes=file_size,
+                file_type=FileType.PDF,
+                page_count=page_count,
+            )
 
-    if page_count == 0:
-        return ValidationResult(False, t("validate.no_pages"), file_size_bytes=file_size, file_type=FileType.PDF)
-
-    return ValidationResult(
-        valid=True,
-        file_size_bytes=file_size,
-        file_type=FileType.PDF,
-        page_count=page_count,
-    )
+    with _pdf_validation_lock:
+        _pdf_validation_cache[key] = result
+        while len(_pdf_validation_cache) > _PDF_VALIDATION_CACHE_SIZE:
+            _pdf_validation_cache.popitem(last=False)
+    return replace(result)
 
 
 def validate_ppt(file_path: str) -> ValidationResult:
@@ -156,19 +186,36 @@ def get_output_path(input_path: str, suffix: str = "_compressed") -> str:
     return str(output)
 
 
+# Free space per directory: (monotonic time of the query, free bytes).
+# statvfs on a network mount can take a noticeable moment, and repeated
+# clicks on the same folder need not ask again within DISK_USAGE_TTL_SECONDS.
+DISK_USAGE_TTL_SECONDS = 1.0
+_disk_free_cache: Dict[str, Tuple[float, int]] = {}
+
+
+def _free_disk_bytes(output_dir: str) -> int:
+    now = time.monotonic()
+    cached = _disk_free_cache.get(output_dir)
+    if cached and now - cached[0] < DISK_USAGE_TTL_SECONDS:
+        return cached[1]
+    free = shutil.disk_usage(output_dir).free
+    _disk_free_cache[output_dir] = (now, free)
+    return free
+
+
 def check_disk_space(output_dir: str, required_bytes: int) -> Tuple[bool, str]:
     """Check if output directory has enough free disk space."""
     try:
-        stat = shutil.disk_usage(output_dir)
+        free = _free_disk_bytes(output_dir)
         # Require 2x safety margin
         needed = required_bytes * 2
-        if stat.free < needed:
+        if free < needed:
             from i18n import t
             return (
                 False,
                 t("validate.disk_space",
                   needed=format_file_size(needed),
-                  available=format_file_size(stat.free)),
+                  available=format_file_size(free)),
             )
         return (True, "")
     except Exception as e:
@@ -185,8 +232,39 @@ def get_platform() -> str:
     return "linux"
 
 
-def detect_libreoffice() -> LibreOfficeInfo:
-    """Detect LibreOffice installation on the system."""
+# Found installations, cached for the life of the process: confirming one
+# means running its --version, which can take a second on a cold start.
+# Misses are not cached (that probe never starts a subprocess), so a tool
+# installed while the app is running is picked up on the next call.
+_tool_cache: dict = {}
+_tool_cache_lock = threading.Lock()
+
+
+def _detect_cached(name: str, probe, refresh: bool):
+    with _tool_cache_lock:
+        info = None if refresh else _tool_cache.get(name)
+    if info is not None and os.path.isfile(info.path):
+        return replace(info)
+
+    info = probe()
+    with _tool_cache_lock:
+        if info.found:
+            _tool_cache[name] = info
+        else:
+            _tool_cache.pop(name, None)
+    return replace(info)
+
+
+def detect_libreoffice(refresh: bool = False) -> LibreOfficeInfo:
+    """Detect LibreOffice installation on the system.
+
+    A found installation is remembered for the rest of the session;
+    pass refresh=True to probe again (e.g. right after installing).
+    """
+    return _detect_cached("libreoffice", _probe_libreoffice, refresh)
+
+
+def _probe_libreoffice() -> LibreOfficeInfo:
     plat = get_platform()
 
     search_paths = []
@@ -285,8 +363,15 @@ class TesseractInfo:
             self.languages = []
 
 
-def detect_tesseract() -> TesseractInfo:
-    """Detect Tesseract OCR installation on the system."""
+def detect_tesseract(refresh: bool = False) -> TesseractInfo:
+    """Detect Tesseract OCR installation on the system.
+
+    Cached like detect_libreoffice(); pass refresh=True to probe again.
+    """
+    return _detect_cached("tesseract", _probe_tesseract, refresh)
+
+
+def _probe_tesseract() -> TesseractInfo:
     plat = get_platform()
 
     search_paths = []
@@ -388,6 +473,45 @@ def validate_image_or_pdf(file_path: str) -> ValidationResult:
     )
 
 
+# Niceness added to worker processes on POSIX (Windows has no os.nice)
+WORKER_PROCESS_NICENESS = 10
+
+
+def default_process_count() -> int:
+    """One worker process per CPU core, less one kept free for the UI."""
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def process_context():
+    """Multiprocessing context for worker processes and their shared objects."""
+    # "spawn" everywhere: forking a process that runs Qt threads is unsafe
+    return multiprocessing.get_context("spawn")
+
+
+def _init_worker_process(initializer, initargs):
+    if hasattr(os, "nice"):
+        # Worker processes yield to the UI process when cores are contended
+        os.nice(WORKER_PROCESS_NICENESS)
+    import fitz
+    fitz.TOOLS.mupdf_display_errors(False)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def process_pool(max_workers: int, initializer=None, initargs: tuple = ()) -> ProcessPoolExecutor:
+    """Pool of low-priority worker processes with MuPDF error output silenced.
+
+    initializer(*initargs) then runs once in each process, as with
+    ProcessPoolExecutor.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=process_context(),
+        initializer=_init_worker_process,
+        initargs=(initializer, initargs),
+    )
+
+
 def get_asset_path(relative_path: str) -> str:
     """Get absolute path to an asset, works for dev and PyInstaller."""
     if getattr(sys, "frozen", False):
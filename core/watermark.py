@@ -217,6 +217,28 @@ class PDFWatermarker:
                 pass
             return WatermarkResult(success=False, error_message=f"Watermarking failed: {e}")
 
+    @staticmethod
+    def render_preview_page(pdf_path: str, width: int) -> tuple:
+        """Render page 1 at the given pixel width for the live preview.
+
+        Returns (RGBA PIL image, zoom), zoom being pixels per PDF point.
+        """
+        from PIL import Image as PILImage
+
+        doc = fitz.open(pdf_path)
+        try:
+            page = doc[0]
+            zoom = width / page.rect.width
+            # Opaque RGB, as the "RGB" raw layout below expects; samples_mv
+            # is a view, so the raster is copied once, by convert()
+            pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom),
+                                  colorspace=fitz.csRGB, alpha=False)
+            img = PILImage.frombuffer("RGB", (pix.width, pix.height), pix.samples_mv,
+                                      "raw", "RGB", pix.stride, 1)
+            return img.convert("RGBA"), zoom
+        finally:
+            doc.close()
+
     @staticmethod
     def _get_position(
         page_w: float, page_h: float,
@@ -4,9 +4,8 @@ import json
 import os
 from collections import OrderedDict
 
-from PyQt6.QtCore import QSettings
-
 from core.utils import get_asset_path
+import app_settings
 
 
 # Supported languages: code -> native display name
@@ -40,8 +39,7 @@ def init():
     """Initialize the translation system. Call once at app startup."""
     global _translations, _fallback, _current_lang
 
-    settings = QSettings("Svetozar Technologies", "LocalPDF")
-    _current_lang = settings.value("language", "en")
+    _current_lang = app_settings.value("language", "en")
     if _current_lang not in LANGUAGES:
         _current_lang = "en"
 
@@ -83,5 +81,4 @@ def is_rtl() -> bool:
 
 def set_language(code: str):
     """Save language preference. Takes effect on next app restart."""
-    settings = QSettings("Svetozar Technologies", "LocalPDF")
-    settings.setValue("language", code)
+    app_settings.set_value("language", code)
@@ -2,14 +2,16 @@
 
 import sys
 import os
+import multiprocessing
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QIcon
+from PyQt6.QtGui import QIcon, QPixmapCache
 from PyQt6.QtCore import Qt
 import fitz  # PyMuPDF
 
 from ui.main_window import MainWindow
 from ui.theme import ThemeManager
+import app_settings
 import i18n
 
 
@@ -25,6 +27,11 @@ def main():
     app.setApplicationName("LocalPDF")
     app.setApplicationVersion("1.1.0")
     app.setOrganizationName("Svetozar Technologies")
+    # Settings writes are cached in memory and flushed once on exit
+    app.aboutToQuit.connect(app_settings.sync)
+
+    # Room for rendered page previews (KB); the 10 MB default holds only a few pages
+    QPixmapCache.setCacheLimit(200 * 1024)
 
     # Translations
     i18n.init()
@@ -43,4 +50,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Page export renders in child processes; frozen builds must hand
+    # control to them here instead of starting another GUI
+    multiprocessing.freeze_support()
     main()
@@ -6,6 +6,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 
+import app_settings
 from ui.components.multi_drop_zone import MultiDropZone
 from ui.components.file_list_widget import FileListWidget, FileStatus
 from ui.components.file_size_input import FileSizeInput
@@ -121,7 +122,9 @@ class BatchCompressWidget(QWidget):
         self._result_card.reset()
         self._progress.start()
 
-        self._worker = BatchCompressWorker(paths, target_bytes)
+        # 0 (the default) lets the worker pick the number of processes
+        workers = app_settings.value("compress_workers", 0, type=int)
+        self._worker = BatchCompressWorker(paths, target_bytes, workers=workers)
         self._worker.progress.connect(self._on_progress)
         self._worker.file_started.connect(self._on_file_started)
         self._worker.file_finished.connect(self._on_file_finished)
@@ -4,7 +4,7 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QProgressBar,
     QLabel, QPushButton,
 )
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import pyqtSignal, QTimer
 
 from i18n import t
 
@@ -16,6 +16,12 @@ class ProgressWidget(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._is_reset = True  # Hidden at 0%; reset() has nothing to do
+        self._tracked = None  # Worker whose latest_progress() is polled
+        # Workers report every page; the bar repaints at most ~30x/s
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(33)
+        self._poll_timer.timeout.connect(self._poll_tracked)
         self._setup_ui()
         self.hide()
 
@@ -54,14 +60,30 @@ class ProgressWidget(QWidget):
 
     def start(self):
         """Show widget and reset to 0%."""
+        self._is_reset = False
         self._bar.setValue(0)
         self._pct_label.setText("0%")
         self._status_label.setText(t("progress.starting"))
         self._cancel_btn.setEnabled(True)
         self.show()
 
+    def track(self, worker):
+        """Follow worker.latest_progress() until finish() or reset()."""
+        self._tracked = worker
+        self._poll_timer.start()
+
+    def _poll_tracked(self):
+        progress = self._tracked.latest_progress() if self._tracked else None
+        if progress is not None:
+            self.update_progress(*progress)
+
+    def _stop_tracking(self):
+        self._poll_timer.stop()
+        self._tracked = None
+
     def update_progress(self, current: int, total: int, message: str):
         """Update progress bar and status text."""
+        self._is_reset = False
         pct = int(current / total * 100) if total > 0 else 0
         pct = min(pct, 100)
         self._bar.setValue(pct)
@@ -70,11 +92,18 @@ class ProgressWidget(QWidget):
 
     def finish(self):
         """Set to 100%, disable cancel."""
+        self._stop_tracking()
+        self._is_reset = False
         self._bar.setValue(100)
         self._pct_label.setText("100%")
         self._cancel_btn.setEnabled(False)
 
     def reset(self):
         """Hide the widget."""
+        self._stop_tracking()
+        # Tabs reset on every file drop/removal, usually when already reset
+        if self._is_reset:
+            return
+        self._is_reset = True
         self._bar.setValue(0)
         self.hide()
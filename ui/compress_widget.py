@@ -142,13 +142,10 @@ class CompressWidget(QWidget):
         self._progress.start()
 
         self._worker = CompressWorker(config)
-        self._worker.progress.connect(self._on_progress)
         self._worker.finished.connect(self._on_compress_finished)
         self._worker.error.connect(self._on_compress_error)
         self._worker.start()
-
-    def _on_progress(self, step: int, total: int, message: str):
-        self._progress.update_progress(step, total, message)
+        self._progress.track(self._worker)
 
     def _on_compress_finished(self, result):
         self._progress.finish()
@@ -11,8 +11,10 @@ from PyQt6.QtCore import Qt
 from ui.components.drop_zone import DropZone
 from ui.components.progress_widget import ProgressWidget
 from ui.components.result_card import ResultCard
+from ui.theme import set_class
 from workers.convert_worker import ConvertWorker
-from core.utils import validate_ppt, get_output_path, detect_libreoffice
+from workers.libreoffice_detect_worker import LibreOfficeDetectWorker
+from core.utils import validate_ppt, get_output_path
 from core.branded_pdf import BrandingConfig
 from i18n import t
 
@@ -25,6 +27,9 @@ class ConvertWidget(QWidget):
         self._current_file = ""
         self._worker: ConvertWorker = None
         self._cover_image_path = ""
+        self._lo_found = False
+        self._lo_detector: LibreOfficeDetectWorker = None
+        self._lo_dialog = None
         self._setup_ui()
         self._connect_signals()
         self._check_libreoffice()
@@ -191,16 +196,27 @@ class ConvertWidget(QWidget):
         self._result_card.compress_another.connect(self._on_another)
         self._mode_group.buttonClicked.connect(self._on_mode_changed)
 
-    def _check_libreoffice(self):
-        lo = detect_libreoffice()
+    def _check_libreoffice(self, refresh: bool = False):
+        # The probe runs `soffice --version`; keep it off the GUI thread
+        if self._lo_detector and self._lo_detector.isRunning():
+            return
+        self._lo_status.setText(t("convert.lo_checking"))
+        self._lo_detector = LibreOfficeDetectWorker(refresh=refresh, parent=self)
+        self._lo_detector.detected.connect(self._on_lo_detected)
+        self._lo_detector.start()
+
+    def _on_lo_detected(self, lo):
+        self._lo_found = lo.found
         if lo.found:
             version = lo.version.split('\n')[0] if lo.version else ""
             self._lo_status.setText(t("convert.lo_detected", version=version))
-            self._lo_status.setProperty("class", "statusGreen")
+            set_class(self._lo_status, "statusGreen")
             self._install_lo_btn.hide()
+            self._convert_btn.setToolTip("")
+            self._convert_btn.setEnabled(bool(self._current_file))
         else:
             self._lo_status.setText(t("convert.lo_not_found"))
-            self._lo_status.setProperty("class", "statusRed")
+            set_class(self._lo_status, "statusRed")
             self._convert_btn.setEnabled(False)
             self._convert_btn.setToolTip(t("convert.lo_install_hint"))
             self._install_lo_btn.show()
@@ -229,8 +245,7 @@ class ConvertWidget(QWidget):
 
         self._current_file = file_path
         # Only enable if LibreOffice is found
-        lo = detect_libreoffice()
-        self._convert_btn.setEnabled(lo.found)
+        self._convert_btn.setEnabled(self._lo_found)
         self._result_card.reset()
         self._progress.reset()
 
@@ -336,16 +351,17 @@ class ConvertWidget(QWidget):
         self._convert_btn.setEnabled(False)
 
     def _on_install_libreoffice(self):
-        from ui.libreoffice_install_dialog import LibreOfficeInstallDialog
-        dialog = LibreOfficeInstallDialog(self)
-        dialog.install_completed.connect(self._on_libreoffice_installed)
-        dialog.exec()
+        # Built once and reused, like the Settings tab's install dialog
+        if self._lo_dialog is None:
+            from ui.libreoffice_install_dialog import LibreOfficeInstallDialog
+            self._lo_dialog = LibreOfficeInstallDialog(self)
+            self._lo_dialog.install_completed.connect(self._on_libreoffice_installed)
+        self._lo_dialog.reset()
+        self._lo_dialog.exec()
 
     def _on_libreoffice_installed(self, soffice_path: str):
-        self._check_libreoffice()
-        if self._current_file:
-            lo = detect_libreoffice()
-            self._convert_btn.setEnabled(lo.found)
+        # Re-enables the convert button once the new install is confirmed
+        self._check_libreoffice(refresh=True)
 
     def cleanup(self):
         if self._worker and self._worker.isRunning():
@@ -354,3 +370,6 @@ class ConvertWidget(QWidget):
                 self._worker.terminate()
                 self._worker.wait(2000)
         self._worker = None
+
+        if self._lo_detector:
+            self._lo_detector.wait(5000)
@@ -1,18 +1,41 @@
 """Continuous scroll edit view for the Page Manager — Sejda-like full-page vertical scroll."""
 
-from typing import Dict, List, Optional, Set
+import hashlib
+import os
+from typing import Iterable, List, Optional, Set
 
 from PIL import Image
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QScrollArea, QFrame, QSizePolicy, QHBoxLayout,
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QRect
-from PyQt6.QtGui import QImage, QPixmap, QMouseEvent
+from PyQt6.QtGui import QImage, QPixmap, QPixmapCache, QMouseEvent
 
 from core.page_manager import PageSource
 from i18n import t
 
 
+def _render_key(source: PageSource, width: int) -> str:
+    """QPixmapCache key for a rendered page: changes whenever its content or size does."""
+    # A file overwritten in place gets a new mtime/size, like the keys of
+    # core.page_manager's render cache; blank pages have no file
+    try:
+        st = os.stat(source.source_path)
+        file_version = f"{st.st_mtime_ns}:{st.st_size}"
+    except OSError:
+        file_version = ""
+    # A digest rather than hash(): stable across runs and effectively
+    # collision-free, while keeping the key short
+    annotations = hashlib.sha1(
+        repr((source.text_annotations, source.image_annotations)).encode()
+    ).hexdigest()
+    return (
+        f"editpage:{source.source_type.value}:{source.source_path}:{file_version}:"
+        f"{source.source_page_index}:{source.rotation}:{width}:"
+        f"{source.width}x{source.height}:{annotations}"
+    )
+
+
 # ---------------------------------------------------------------------------
 # Single page card in the continuous scroll
 # ---------------------------------------------------------------------------
@@ -105,12 +128,16 @@ class _EditPageCard(QFrame):
         else:
             self.setStyleSheet("")
 
-    def set_page_image(self, img: Image.Image):
+    def set_page_image(self, img: Image.Image) -> QPixmap:
         img_rgb = img.convert("RGB")
         data = img_rgb.tobytes()
         qimg = QImage(data, img_rgb.width, img_rgb.height,
                        3 * img_rgb.width, QImage.Format.Format_RGB888)
         pixmap = QPixmap.fromImage(qimg)
+        self.set_page_pixmap(pixmap)
+        return pixmap
+
+    def set_page_pixmap(self, pixmap: QPixmap):
         self._image_label.setFixedSize(pixmap.width(), pixmap.height())
         self._image_label.setPixmap(pixmap)
         self._image_label.setText("")
@@ -175,7 +202,6 @@ class EditViewWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._cards: List[_EditPageCard] = []
-        self._render_cache: Dict[int, Image.Image] = {}
         self._pending_renders: Set[int] = set()
         self._render_workers: list = []
         self._scroll_timer = QTimer()
@@ -222,14 +248,24 @@ class EditViewWidget(QWidget):
 
     def update_card_at(self, index: int):
         """Re-render a single card (e.g., after annotation change)."""
-        if 0 <= index < len(self._cards):
-            card = self._cards[index]
-            card.update_annotation_indicator()
-            # Invalidate cache and re-render
-            if index in self._render_cache:
-                del self._render_cache[index]
-            card.set_placeholder()
-            self._render_page(index)
+        self.update_cards([index])
+
+    def update_cards(self, indices: Iterable[int]):
+        """Invalidate several cards at once (e.g., after a bulk annotation).
+
+        Cards are reset to placeholders in one pass; only those near the
+        viewport are re-rendered now, the rest render lazily on scroll.
+        """
+        self._container.setUpdatesEnabled(False)
+        try:
+            for index in indices:
+                if 0 <= index < len(self._cards):
+                    card = self._cards[index]
+                    card.update_annotation_indicator()
+                    card.set_placeholder()
+        finally:
+            self._container.setUpdatesEnabled(True)
+        self._render_visible_pages()
 
     def scroll_to_page(self, index: int):
         """Scroll the view to bring the given page into view."""
@@ -290,24 +326,31 @@ class EditViewWidget(QWidget):
                 self._render_page(i)
 
     def _render_page(self, index: int):
-        """Start a background render for the given page index."""
+        """Show the page from the pixmap cache, or start a background render."""
         if index in self._pending_renders:
             return
+
+        source = self._cards[index].source
+        key = _render_key(source, self.PAGE_WIDTH)
+        cached = QPixmapCache.find(key)
+        if cached is not None:
+            self._cards[index].set_page_pixmap(cached)
+            return
+
         self._pending_renders.add(index)
 
         from workers.page_manager_worker import FullPageRenderWorker
-        source = self._cards[index].source
         worker = FullPageRenderWorker(source, max_width=self.PAGE_WIDTH)
-        worker.finished.connect(lambda img, idx=index: self._on_page_rendered(idx, img))
+        worker.finished.connect(lambda img, idx=index, k=key: self._on_page_rendered(idx, k, img))
         worker.error.connect(lambda msg, idx=index: self._on_page_render_error(idx, msg))
         self._render_workers.append(worker)
         worker.start()
 
-    def _on_page_rendered(self, index: int, img: Image.Image):
+    def _on_page_rendered(self, index: int, key: str, img: Image.Image):
         self._pending_renders.discard(index)
         if 0 <= index < len(self._cards):
-            self._render_cache[index] = img
-            self._cards[index].set_page_image(img)
+            pixmap = self._cards[index].set_page_image(img)
+            QPixmapCache.insert(key, pixmap)
 
     def _on_page_render_error(self, index: int, msg: str):
         self._pending_renders.discard(index)
@@ -320,7 +363,6 @@ class EditViewWidget(QWidget):
                 worker.cancel()
         self._render_workers.clear()
         self._pending_renders.clear()
-        self._render_cache.clear()
 
         for card in self._cards:
             self._v_layout.removeWidget(card)
@@ -163,14 +163,10 @@ class ImageToPdfWidget(QWidget):
         self._progress.start()
 
         self._worker = ImageToPdfWorker(paths, output_path, orientation)
-        self._worker.progress.connect(self._on_progress)
         self._worker.finished.connect(self._on_convert_finished)
         self._worker.error.connect(self._on_convert_error)
         self._worker.start()
-
-    def _on_progress(self, step: int, total: int, message: str):
-        pct = int(step / total * 100) if total > 0 else 0
-        self._progress.update_progress(pct, 100, message)
+        self._progress.track(self._worker)
 
     def _on_convert_finished(self, result):
         self._progress.finish()
@@ -1,6 +1,6 @@
 """Dialog for selecting and inserting pages from another PDF."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from PIL import Image
 from PyQt6.QtWidgets import (
@@ -10,7 +10,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal, QPoint
 from PyQt6.QtGui import QImage, QPixmap
 
-from core.page_manager import PageSource, PageSourceType, PageManager
+from core.page_manager import PageSource, PageSourceType
 from workers.page_manager_worker import ThumbnailWorker
 from i18n import t
 
@@ -93,6 +93,7 @@ class InsertPagesDialog(QDialog):
         self._cells: List[_InsertThumbnail] = []
         self._selected_indices: List[int] = []
         self._thumbnails: dict = {}
+        self._page_sizes: Dict[int, Tuple[float, float]] = {}  # page index -> (width, height)
         self._thumbnail_worker: Optional[ThumbnailWorker] = None
         self._result_sources: List[PageSource] = []
 
@@ -178,8 +179,9 @@ class InsertPagesDialog(QDialog):
         self._thumbnail_worker.error.connect(self._on_thumbnail_error)
         self._thumbnail_worker.start()
 
-    def _on_thumbnail_ready(self, index: int, img: Image.Image):
+    def _on_thumbnail_ready(self, index: int, img: Image.Image, width: float, height: float):
         self._thumbnails[index] = img
+        self._page_sizes[index] = (width, height)
 
         cell = _InsertThumbnail(index)
         cell.set_thumbnail(img)
@@ -238,22 +240,18 @@ class InsertPagesDialog(QDialog):
         self._insert_btn.setEnabled(count > 0)
 
     def _on_insert(self):
-        manager = PageManager()
         self._result_sources = []
         for idx in sorted(self._selected_indices):
-            src = PageSource(
+            # Only pages whose thumbnail has arrived can be selected, so the
+            # size the thumbnail worker reported is always there
+            width, height = self._page_sizes[idx]
+            self._result_sources.append(PageSource(
                 source_type=PageSourceType.EXTERNAL,
                 source_path=self._source_path,
                 source_page_index=idx,
-            )
-            # Read actual page dimensions
-            import fitz
-            doc = fitz.open(self._source_path)
-            page = doc[idx]
-            src.width = page.rect.width
-            src.height = page.rect.height
-            doc.close()
-            self._result_sources.append(src)
+                width=width,
+                height=height,
+            ))
         self.accept()
 
     def get_selected_sources(self) -> List[PageSource]:
@@ -269,6 +267,7 @@ class InsertPagesDialog(QDialog):
             cell.deleteLater()
         self._cells.clear()
         self._thumbnails.clear()
+        self._page_sizes.clear()
         self._selected_indices.clear()
 
     def closeEvent(self, event):
@@ -77,6 +77,17 @@ class LibreOfficeInstallDialog(QDialog):
 
         layout.addLayout(btn_row)
 
+    def reset(self):
+        """Return to the initial prompt so a cached dialog can be shown again."""
+        self._progress_bar.setValue(0)
+        self._progress_bar.hide()
+        self._status_label.setText("")
+        self._status_label.hide()
+        self._install_btn.setEnabled(True)
+        self._install_btn.setText(t("lo_install.download"))
+        self._cancel_btn.setText(t("lo_install.not_now"))
+        self._manual_btn.show()
+
     def _start_install(self):
         self._install_btn.setEnabled(False)
         self._cancel_btn.setText(t("common.cancel"))
@@ -230,12 +230,16 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Clean up workers on close."""
+        # Take the window off screen right away; worker shutdown below may
+        # still need a moment.
+        self.hide()
         widgets = [
             self._compress_widget, self._batch_compress_widget,
             self._merge_widget, self._split_widget,
             self._protect_widget, self._watermark_widget,
             self._image_to_pdf_widget, self._pdf_to_image_widget,
             self._convert_widget, self._page_manager_widget,
+            self._settings_widget,
         ]
         for w in widgets:
             w.cleanup()
@@ -44,6 +44,7 @@ class _PageThumbnail(QFrame):
         self._source = source
         self._selected = False
         self._drag_start_pos: Optional[QPoint] = None
+        self._drag_pixmap: Optional[QPixmap] = None
         self.setFixedSize(170, 220)
         self.setProperty("class", "pageThumbnail")
         self._setup_ui()
@@ -117,16 +118,34 @@ class _PageThumbnail(QFrame):
             self._ann_label.hide()
 
     def set_thumbnail(self, img: Image.Image):
-        img_rgb = img.convert("RGB")
-        data = img_rgb.tobytes()
+        # Rendered thumbnails are already RGB; convert() would still copy
+        img_rgb = img if img.mode == "RGB" else img.convert("RGB")
+        data = img_rgb.tobytes()  # QImage only wraps it; keep alive until scaled
         qimg = QImage(data, img_rgb.width, img_rgb.height, 3 * img_rgb.width, QImage.Format.Format_RGB888)
-        pixmap = QPixmap.fromImage(qimg)
-        scaled = pixmap.scaled(
+        # Scale before the pixmap upload so only the smaller image is copied
+        scaled = qimg.scaled(
             self.THUMB_WIDTH, 170,
             Qt.AspectRatioMode.KeepAspectRatio,
             Qt.TransformationMode.SmoothTransformation,
         )
-        self._image_label.setPixmap(scaled)
+        self._image_label.setPixmap(QPixmap.fromImage(scaled))
+        self._drag_pixmap = None
+
+    def drag_pixmap(self) -> Optional[QPixmap]:
+        """Small cursor pixmap for drag-reorder, scaled once at the screen's pixel ratio."""
+        dpr = self.devicePixelRatioF()
+        if self._drag_pixmap is None or self._drag_pixmap.devicePixelRatio() != dpr:
+            source = self._image_label.pixmap()
+            if source is None or source.isNull():
+                return None
+            pixmap = source.scaled(
+                int(80 * dpr), int(100 * dpr),
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            pixmap.setDevicePixelRatio(dpr)
+            self._drag_pixmap = pixmap
+        return self._drag_pixmap
 
     @property
     def cell_id(self) -> int:
@@ -202,9 +221,13 @@ class PageManagerWidget(QWidget):
         self._save_worker: Optional[EnhancedSaveWorker] = None
         self._cells: List[_PageThumbnail] = []
         self._cell_thumbnails: Dict[int, Image.Image] = {}  # cell_id -> PIL Image
-        self._selected_ids: List[int] = []  # cell_ids of selected cells
+        # Selected cell_ids as an insertion-ordered set (dict keys): O(1)
+        # membership while remembering which cell was selected last.
+        self._selected_ids: Dict[int, None] = {}
+        self._id_to_pos: Dict[int, int] = {}  # cell_id -> position in _cells
         self._drag_source: Optional[int] = None  # position in _cells
         self._current_view = "grid"  # "grid" or "edit"
+        self._grid_cols = 0  # Columns of the last full grid layout
         self._setup_ui()
         self._connect_signals()
 
@@ -457,20 +480,13 @@ class PageManagerWidget(QWidget):
         self._result_card.reset()
         self._progress.reset()
 
-    def _on_thumbnail_ready(self, index: int, img: Image.Image):
-        import fitz
-        # Read actual page dimensions
-        doc = fitz.open(self._current_file)
-        page = doc[index]
-        w, h = page.rect.width, page.rect.height
-        doc.close()
-
+    def _on_thumbnail_ready(self, index: int, img: Image.Image, width: float, height: float):
         source = PageSource(
             source_type=PageSourceType.ORIGINAL,
             source_path=self._current_file,
             source_page_index=index,
-            width=w,
-            height=h,
+            width=width,
+            height=height,
         )
         cell = _PageThumbnail(source)
         cell.set_thumbnail(img)
@@ -480,7 +496,13 @@ class PageManagerWidget(QWidget):
         self._cells.append(cell)
         self._cell_thumbnails[cell.cell_id] = img
 
-        self._relayout_grid()
+        # Thumbnails arrive in page order at the end of the grid; placing
+        # just the new cell keeps a long document from re-laying every
+        # earlier cell once per page
+        if self._grid_columns() != self._grid_cols:
+            self._relayout_grid()
+        else:
+            self._append_to_grid(cell)
 
     def _on_thumbnails_finished(self):
         self._thumbnail_worker = None
@@ -492,15 +514,29 @@ class PageManagerWidget(QWidget):
 
     # ------------------------------------------------------------------ Grid layout
 
+    def _grid_columns(self) -> int:
+        return max(1, (self._grid_scroll.viewport().width() - 20) // 182)
+
+    def _append_to_grid(self, cell: _PageThumbnail):
+        """Place the last cell of _cells without touching the others."""
+        i = len(self._cells) - 1
+        row, col = divmod(i, self._grid_cols)
+        cell.update_label(i)
+        self._grid_layout.addWidget(cell, row, col, alignment=Qt.AlignmentFlag.AlignTop)
+        self._id_to_pos[cell.cell_id] = i
+
     def _relayout_grid(self):
         while self._grid_layout.count():
             self._grid_layout.takeAt(0)
 
-        cols = max(1, (self._grid_scroll.viewport().width() - 20) // 182)
+        cols = self._grid_columns()
+        self._grid_cols = cols
+        self._id_to_pos = {}
         for i, cell in enumerate(self._cells):
             row, col = divmod(i, cols)
             cell.update_label(i)
             self._grid_layout.addWidget(cell, row, col, alignment=Qt.AlignmentFlag.AlignTop)
+            self._id_to_pos[cell.cell_id] = i
 
     def _clear_grid(self):
         for cell in self._cells:
@@ -509,23 +545,17 @@ class PageManagerWidget(QWidget):
         self._cells.clear()
         self._cell_thumbnails.clear()
         self._selected_ids.clear()
+        self._id_to_pos.clear()
 
     # ------------------------------------------------------------------ Helpers
 
     def _pos_of_id(self, cell_id: int) -> Optional[int]:
-        for i, cell in enumerate(self._cells):
-            if cell.cell_id == cell_id:
-                return i
-        return None
+        return self._id_to_pos.get(cell_id)
 
     def _selected_positions(self) -> List[int]:
         """Return sorted list of positions for selected cell_ids."""
-        positions = []
-        for cid in self._selected_ids:
-            p = self._pos_of_id(cid)
-            if p is not None:
-                positions.append(p)
-        return sorted(positions)
+        id_to_pos = self._id_to_pos
+        return sorted(id_to_pos[cid] for cid in self._selected_ids if cid in id_to_pos)
 
     # ------------------------------------------------------------------ Selection
 
@@ -539,19 +569,17 @@ class PageManagerWidget(QWidget):
 
         if ctrl:
             if cell_id in self._selected_ids:
-                self._selected_ids.remove(cell_id)
+                del self._selected_ids[cell_id]
             else:
-                self._selected_ids.append(cell_id)
+                self._selected_ids[cell_id] = None
         elif shift and self._selected_ids:
-            last_pos = self._pos_of_id(self._selected_ids[-1])
+            last_pos = self._pos_of_id(next(reversed(self._selected_ids)))
             if last_pos is not None:
                 start, end = min(last_pos, pos), max(last_pos, pos)
                 for j in range(start, end + 1):
-                    cid = self._cells[j].cell_id
-                    if cid not in self._selected_ids:
-                        self._selected_ids.append(cid)
+                    self._selected_ids.setdefault(self._cells[j].cell_id, None)
         else:
-            self._selected_ids = [cell_id]
+            self._selected_ids = {cell_id: None}
 
         self._update_selection_display()
 
@@ -565,9 +593,8 @@ class PageManagerWidget(QWidget):
         dlg.exec()
 
     def _update_selection_display(self):
-        selected_set = set(self._selected_ids)
         for cell in self._cells:
-            cell.selected = (cell.cell_id in selected_set)
+            cell.selected = (cell.cell_id in self._selected_ids)
 
         count = len(self._selected_ids)
         if count == 0:
@@ -580,7 +607,7 @@ class PageManagerWidget(QWidget):
         if len(self._selected_ids) == len(self._cells):
             self._selected_ids.clear()
         else:
-            self._selected_ids = [cell.cell_id for cell in self._cells]
+            self._selected_ids = dict.fromkeys(cell.cell_id for cell in self._cells)
         self._update_selection_display()
 
     # ------------------------------------------------------------------ Basic operations
@@ -680,7 +707,7 @@ class PageManagerWidget(QWidget):
         self._cell_thumbnails[cell.cell_id] = img
 
         self._relayout_grid()
-        self._selected_ids = [cell.cell_id]
+        self._selected_ids = {cell.cell_id: None}
         self._update_selection_display()
         self._save_btn.setEnabled(True)
         self._sync_edit_view()
@@ -713,7 +740,7 @@ class PageManagerWidget(QWidget):
             insert_at += 1
 
         self._relayout_grid()
-        self._selected_ids = new_ids
+        self._selected_ids = dict.fromkeys(new_ids)
         self._update_selection_display()
         self._save_btn.setEnabled(True)
         self._sync_edit_view()
@@ -735,10 +762,10 @@ class PageManagerWidget(QWidget):
         self._progress.start()
 
         self._save_worker = EnhancedSaveWorker(sources, output_path)
-        self._save_worker.progress.connect(self._on_save_progress)
         self._save_worker.finished.connect(self._on_extract_finished)
         self._save_worker.error.connect(self._on_save_error)
         self._save_worker.start()
+        self._progress.track(self._save_worker)
 
     def _on_extract_finished(self, result):
         self._progress.finish()
@@ -789,7 +816,7 @@ class PageManagerWidget(QWidget):
             insert_pos += 1
 
         self._relayout_grid()
-        self._selected_ids = new_ids
+        self._selected_ids = dict.fromkeys(new_ids)
         self._update_selection_display()
         self._save_btn.setEnabled(True)
         self._sync_edit_view()
@@ -815,9 +842,7 @@ class PageManagerWidget(QWidget):
         # Apply to all selected pages
         for pos in positions:
             self._cells[pos].source.text_annotations.append(copy.deepcopy(annotation))
-            self._cells[pos].update_annotation_indicator()
-            if self._current_view == "edit":
-                self._edit_view.update_card_at(pos)
+        self._refresh_annotated(positions)
 
         self._save_btn.setEnabled(True)
 
@@ -840,9 +865,7 @@ class PageManagerWidget(QWidget):
 
         for pos in positions:
             self._cells[pos].source.image_annotations.append(copy.deepcopy(annotation))
-            self._cells[pos].update_annotation_indicator()
-            if self._current_view == "edit":
-                self._edit_view.update_card_at(pos)
+        self._refresh_annotated(positions)
 
         self._save_btn.setEnabled(True)
 
@@ -865,9 +888,7 @@ class PageManagerWidget(QWidget):
 
         for pos in positions:
             self._cells[pos].source.image_annotations.append(copy.deepcopy(annotation))
-            self._cells[pos].update_annotation_indicator()
-            if self._current_view == "edit":
-                self._edit_view.update_card_at(pos)
+        self._refresh_annotated(positions)
 
         self._save_btn.setEnabled(True)
 
@@ -890,9 +911,7 @@ class PageManagerWidget(QWidget):
         dlg.exec()
 
         if dlg.was_modified():
-            first_cell.update_annotation_indicator()
-            if self._current_view == "edit":
-                self._edit_view.update_card_at(positions[0])
+            self._refresh_annotated(positions[:1])
             self._save_btn.setEnabled(True)
 
     def _on_eraser(self):
@@ -913,12 +932,21 @@ class PageManagerWidget(QWidget):
             return
 
         first_cell.source.image_annotations.append(annotation)
-        first_cell.update_annotation_indicator()
-        if self._current_view == "edit":
-            self._edit_view.update_card_at(positions[0])
+        self._refresh_annotated(positions[:1])
 
         self._save_btn.setEnabled(True)
 
+    def _refresh_annotated(self, positions: List[int]):
+        """Refresh annotation indicators for the given cells in a single repaint."""
+        self._grid_container.setUpdatesEnabled(False)
+        try:
+            for pos in positions:
+                self._cells[pos].update_annotation_indicator()
+        finally:
+            self._grid_container.setUpdatesEnabled(True)
+        if self._current_view == "edit":
+            self._edit_view.update_cards(positions)
+
     # ------------------------------------------------------------------ View toggle
 
     def _on_toggle_view(self):
@@ -978,10 +1006,9 @@ class PageManagerWidget(QWidget):
         mime.setText(str(source_pos))
         drag.setMimeData(mime)
 
-        if self._cells[source_pos]._image_label.pixmap():
-            drag.setPixmap(self._cells[source_pos]._image_label.pixmap().scaled(
-                80, 100, Qt.AspectRatioMode.KeepAspectRatio,
-            ))
+        pixmap = self._cells[source_pos].drag_pixmap()
+        if pixmap is not None:
+            drag.setPixmap(pixmap)
 
         drag.exec(Qt.DropAction.MoveAction)
 
@@ -1000,7 +1027,7 @@ class PageManagerWidget(QWidget):
         if drop_pos is not None and drop_pos != self._drag_source:
             cell = self._cells.pop(self._drag_source)
             self._cells.insert(drop_pos, cell)
-            self._selected_ids = [cell.cell_id]
+            self._selected_ids = {cell.cell_id: None}
             self._relayout_grid()
             self._update_selection_display()
             self._save_btn.setEnabled(True)
@@ -1032,13 +1059,10 @@ class PageManagerWidget(QWidget):
         self._progress.start()
 
         self._save_worker = EnhancedSaveWorker(page_sources, output_path)
-        self._save_worker.progress.connect(self._on_save_progress)
         self._save_worker.finished.connect(self._on_save_finished)
         self._save_worker.error.connect(self._on_save_error)
         self._save_worker.start()
-
-    def _on_save_progress(self, step: int, total: int, message: str):
-        self._progress.update_progress(step, total, message)
+        self._progress.track(self._save_worker)
 
     def _on_save_finished(self, result):
         self._progress.finish()
@@ -1086,18 +1110,25 @@ class PageManagerWidget(QWidget):
         self._current_file = ""
 
     def cleanup(self):
-        if self._thumbnail_worker and self._thumbnail_worker.isRunning():
-            self._thumbnail_worker.cancel()
-            if not self._thumbnail_worker.wait(5000):
-                self._thumbnail_worker.terminate()
-                self._thumbnail_worker.wait(2000)
+        # Signal every worker first so they wind down in parallel.
+        thumbnail_worker = self._thumbnail_worker
+        save_worker = self._save_worker
+        for worker in (thumbnail_worker, save_worker):
+            if worker and worker.isRunning():
+                worker.cancel()
+        self._edit_view.cleanup()
+
+        # Thumbnail rendering checks for cancellation between pages, but one
+        # large scanned page can take seconds; terminate() is a last resort
+        # for a thread running Python, so give it the full wait.
+        if thumbnail_worker and not thumbnail_worker.wait(5000):
+            thumbnail_worker.terminate()
+            thumbnail_worker.wait(2000)
         self._thumbnail_worker = None
 
-        if self._save_worker and self._save_worker.isRunning():
-            self._save_worker.cancel()
-            if not self._save_worker.wait(5000):
-                self._save_worker.terminate()
-                self._save_worker.wait(2000)
+        # A save may be inside doc.save(); let it finish writing rather than
+        # terminating it mid-file.
+        if save_worker and not save_worker.wait(5000):
+            save_worker.terminate()
+            save_worker.wait(2000)
         self._save_worker = None
-
-        self._edit_view.cleanup()
@@ -4,28 +4,37 @@ import os
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMessageBox,
     QScrollArea, QGroupBox, QRadioButton, QButtonGroup, QComboBox, QLineEdit,
-    QFileDialog,
+    QFileDialog, QStackedWidget,
 )
 from PyQt6.QtCore import Qt
 
 from ui.components.drop_zone import DropZone
 from ui.components.progress_widget import ProgressWidget
 from ui.components.result_card import ResultCard
+from workers.validate_worker import ValidateWorker
 from workers.pdf_to_image_worker import PDFToImageWorker
 from core.pdf_to_image import ImageFormat
 from core.splitter import PageRangeParser
-from core.utils import validate_pdf, format_file_size, check_disk_space
+from core.utils import format_file_size, check_disk_space
+import app_settings
 from i18n import t
 
 
 class PDFToImageWidget(QWidget):
     """PDF-to-Image export tab: export pages as PNG or JPEG."""
 
+    # Pages of the phase stack: only the active phase is laid out and polished
+    _PAGE_SETUP = 0
+    _PAGE_PROGRESS = 1
+    _PAGE_RESULT = 2
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._current_file = ""
         self._page_count = 0
+        self._file_size = 0
         self._worker: PDFToImageWorker = None
+        self._validate_generation = 0
         self._setup_ui()
         self._connect_signals()
 
@@ -48,18 +57,25 @@ class PDFToImageWidget(QWidget):
         subtitle.setWordWrap(True)
         layout.addWidget(subtitle)
 
+        self._phase_stack = QStackedWidget()
+
+        setup_page = QWidget()
+        setup_layout = QVBoxLayout(setup_page)
+        setup_layout.setContentsMargins(0, 0, 0, 0)
+        setup_layout.setSpacing(16)
+
         # Drop zone
         self._drop_zone = DropZone(
             accepted_extensions=[".pdf"],
             placeholder_text=t("pdf_to_image.drop_text"),
         )
-        layout.addWidget(self._drop_zone)
+        setup_layout.addWidget(self._drop_zone)
 
         # Page info
         self._page_info = QLabel("")
         self._page_info.setProperty("class", "pageInfo")
         self._page_info.hide()
-        layout.addWidget(self._page_info)
+        setup_layout.addWidget(self._page_info)
 
         # Options group
         options_group = QGroupBox(t("pdf_to_image.options"))
@@ -98,21 +114,36 @@ class PDFToImageWidget(QWidget):
         dpi_row.addStretch()
         options_layout.addLayout(dpi_row)
 
-        layout.addWidget(options_group)
+        setup_layout.addWidget(options_group)
 
         # Export button
         self._export_btn = QPushButton(t("pdf_to_image.button"))
         self._export_btn.setObjectName("primaryButton")
         self._export_btn.setEnabled(False)
-        layout.addWidget(self._export_btn)
+        setup_layout.addWidget(self._export_btn)
+        setup_layout.addStretch()
+
+        self._phase_stack.addWidget(setup_page)
 
         # Progress
+        progress_page = QWidget()
+        progress_layout = QVBoxLayout(progress_page)
+        progress_layout.setContentsMargins(0, 0, 0, 0)
         self._progress = ProgressWidget()
-        layout.addWidget(self._progress)
+        progress_layout.addWidget(self._progress)
+        progress_layout.addStretch()
+        self._phase_stack.addWidget(progress_page)
 
         # Result
+        result_page = QWidget()
+        result_layout = QVBoxLayout(result_page)
+        result_layout.setContentsMargins(0, 0, 0, 0)
         self._result_card = ResultCard()
-        layout.addWidget(self._result_card)
+        result_layout.addWidget(self._result_card)
+        result_layout.addStretch()
+        self._phase_stack.addWidget(result_page)
+
+        layout.addWidget(self._phase_stack)
 
         layout.addStretch()
 
@@ -130,14 +161,34 @@ class PDFToImageWidget(QWidget):
         self._result_card.compress_another.connect(self._on_another)
 
     def _on_file_selected(self, file_path: str):
-        result = validate_pdf(file_path)
+        # Validation opens the PDF, which can take seconds for large or
+        # damaged files, so run it off the GUI thread.
+        self._validate_generation += 1
+        self._current_file = ""
+        self._page_count = 0
+        self._file_size = 0
+        self._page_info.setText(t("validate.validating"))
+        self._page_info.show()
+        self._export_btn.setEnabled(False)
+
+        worker = ValidateWorker(file_path, self._validate_generation, parent=self)
+        worker.validated.connect(self._on_file_validated)
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
+
+    def _on_file_validated(self, generation: int, file_path: str, result):
+        if generation != self._validate_generation:
+            return  # Superseded by a newer file or removal
+
         if not result.valid:
+            self._page_info.hide()
             QMessageBox.warning(self, t("common.invalid_file"), result.error_message)
             self._drop_zone.reset()
             return
 
         self._current_file = file_path
         self._page_count = result.page_count
+        self._file_size = result.file_size_bytes
         self._page_info.setText(t("split.pages_info", count=result.page_count))
         self._page_info.show()
         self._export_btn.setEnabled(True)
@@ -145,8 +196,10 @@ class PDFToImageWidget(QWidget):
         self._progress.reset()
 
     def _on_file_removed(self):
+        self._validate_generation += 1
         self._current_file = ""
         self._page_count = 0
+        self._file_size = 0
         self._page_info.hide()
         self._export_btn.setEnabled(False)
         self._result_card.reset()
@@ -155,6 +208,10 @@ class PDFToImageWidget(QWidget):
     def _get_dpi(self) -> int:
         return self._dpi_combo.currentData() or 300
 
+    def _get_workers(self) -> int:
+        # 0 (the default) lets the converter use one render process per core
+        return app_settings.value("render_workers", 0, type=int)
+
     def _get_format(self) -> ImageFormat:
         return ImageFormat.JPEG if self._jpeg_radio.isChecked() else ImageFormat.PNG
 
@@ -180,9 +237,8 @@ class PDFToImageWidget(QWidget):
         if not output_dir:
             return
 
-        # Check disk space
-        file_size = os.path.getsize(self._current_file)
-        has_space, space_msg = check_disk_space(output_dir, file_size * 3)
+        # Check disk space (input size was recorded during validation)
+        has_space, space_msg = check_disk_space(output_dir, self._file_size * 3)
         if not has_space:
             QMessageBox.warning(self, t("common.disk_space"), space_msg)
             return
@@ -190,6 +246,7 @@ class PDFToImageWidget(QWidget):
         self._export_btn.setEnabled(False)
         self._result_card.reset()
         self._progress.start()
+        self._phase_stack.setCurrentIndex(self._PAGE_PROGRESS)
 
         self._worker = PDFToImageWorker(
             input_path=self._current_file,
@@ -197,15 +254,12 @@ class PDFToImageWidget(QWidget):
             page_numbers=page_numbers,
             image_format=self._get_format(),
             dpi=self._get_dpi(),
+            workers=self._get_workers(),
         )
-        self._worker.progress.connect(self._on_progress)
         self._worker.finished.connect(self._on_export_finished)
         self._worker.error.connect(self._on_export_error)
         self._worker.start()
-
-    def _on_progress(self, step: int, total: int, message: str):
-        pct = int(step / total * 100) if total > 0 else 0
-        self._progress.update_progress(pct, 100, message)
+        self._progress.track(self._worker)
 
     def _on_export_finished(self, result):
         self._progress.finish()
@@ -217,12 +271,15 @@ class PDFToImageWidget(QWidget):
                 result.output_dir,
                 title=t("pdf_to_image.complete", pages=result.pages_exported),
             )
+            self._phase_stack.setCurrentIndex(self._PAGE_RESULT)
         else:
             QMessageBox.critical(self, t("common.error"), result.error_message or t("pdf_to_image.failed"))
             self._progress.reset()
+            self._phase_stack.setCurrentIndex(self._PAGE_SETUP)
 
     def _on_export_error(self, error_msg: str):
         self._progress.reset()
+        self._phase_stack.setCurrentIndex(self._PAGE_SETUP)
         self._export_btn.setEnabled(True)
         self._worker = None
         QMessageBox.critical(self, t("common.error"), error_msg)
@@ -233,15 +290,18 @@ class PDFToImageWidget(QWidget):
             self._worker.wait(5000)
             self._worker = None
         self._progress.reset()
+        self._phase_stack.setCurrentIndex(self._PAGE_SETUP)
         self._export_btn.setEnabled(bool(self._current_file))
 
     def _on_another(self):
         self._drop_zone.reset()
         self._result_card.reset()
         self._progress.reset()
+        self._phase_stack.setCurrentIndex(self._PAGE_SETUP)
         self._range_input.clear()
         self._current_file = ""
         self._page_count = 0
+        self._file_size = 0
         self._page_info.hide()
         self._export_btn.setEnabled(False)
 
@@ -252,3 +312,7 @@ class PDFToImageWidget(QWidget):
                 self._worker.terminate()
                 self._worker.wait(2000)
         self._worker = None
+
+        self._validate_generation += 1
+        for validator in self.findChildren(ValidateWorker):
+            validator.wait(5000)
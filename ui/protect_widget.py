@@ -15,6 +15,11 @@ from core.protector import ProtectConfig, UnlockConfig
 from core.utils import validate_pdf, get_output_path, format_file_size
 from i18n import t
 
+# AES-256 (PDF 2.0) security handlers use at most 127 bytes of a password;
+# capping the fields also keeps a huge accidental paste out of the
+# password-masked line edits, which re-lay out their whole text per keystroke.
+MAX_PASSWORD_LENGTH = 127
+
 
 class ProtectWidget(QWidget):
     """PDF Protect/Unlock tab: add or remove passwords from PDFs."""
@@ -77,6 +82,7 @@ class ProtectWidget(QWidget):
         self._user_pw_input = QLineEdit()
         self._user_pw_input.setPlaceholderText(t("protect.open_password_hint"))
         self._user_pw_input.setEchoMode(QLineEdit.EchoMode.Password)
+        self._user_pw_input.setMaxLength(MAX_PASSWORD_LENGTH)
         row1.addWidget(self._user_pw_input)
         protect_layout.addLayout(row1)
 
@@ -86,6 +92,7 @@ class ProtectWidget(QWidget):
         self._owner_pw_input = QLineEdit()
         self._owner_pw_input.setPlaceholderText(t("protect.owner_password_hint"))
         self._owner_pw_input.setEchoMode(QLineEdit.EchoMode.Password)
+        self._owner_pw_input.setMaxLength(MAX_PASSWORD_LENGTH)
         row2.addWidget(self._owner_pw_input)
         protect_layout.addLayout(row2)
 
@@ -119,6 +126,7 @@ class ProtectWidget(QWidget):
         self._unlock_pw_input = QLineEdit()
         self._unlock_pw_input.setPlaceholderText(t("protect.password_hint"))
         self._unlock_pw_input.setEchoMode(QLineEdit.EchoMode.Password)
+        self._unlock_pw_input.setMaxLength(MAX_PASSWORD_LENGTH)
         row3.addWidget(self._unlock_pw_input)
         unlock_layout.addLayout(row3)
 
@@ -250,13 +258,10 @@ class ProtectWidget(QWidget):
             protect_config=protect_config,
             unlock_config=unlock_config,
         )
-        self._worker.progress.connect(self._on_progress)
         self._worker.finished.connect(self._on_finished)
         self._worker.error.connect(self._on_error)
         self._worker.start()
-
-    def _on_progress(self, step: int, total: int, message: str):
-        self._progress.update_progress(step, total, message)
+        self._progress.track(self._worker)
 
     def _on_finished(self, result):
         self._progress.finish()
@@ -1,14 +1,25 @@
 """Settings tab widget."""
 
+import os
+import time
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QGroupBox,
     QFileDialog, QScrollArea, QComboBox, QMessageBox,
 )
-from PyQt6.QtCore import Qt, QSettings
+from PyQt6.QtCore import Qt, QTimer
 
-from core.utils import detect_libreoffice, get_libreoffice_install_instructions
+import app_settings
+from ui.theme import set_class
 from i18n import t, LANGUAGES, current_language, set_language
 
+# How long a detected LibreOffice installation is trusted before re-probing
+LO_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+def _preload_install_dialog():
+    import ui.libreoffice_install_dialog  # noqa: F401
+
 
 class SettingsWidget(QWidget):
     """Settings tab: theme, output folder, LibreOffice status."""
@@ -16,7 +27,14 @@ class SettingsWidget(QWidget):
     def __init__(self, theme_manager=None, parent=None):
         super().__init__(parent)
         self._theme_manager = theme_manager
-        self._settings = QSettings("Svetozar Technologies", "LocalPDF")
+        self._lo_detector = None
+        self._lo_dialog = None
+        # Arrow keys step through the language list one index at a time;
+        # only the language the user settles on is saved and announced
+        self._lang_timer = QTimer(self)
+        self._lang_timer.setSingleShot(True)
+        self._lang_timer.setInterval(150)
+        self._lang_timer.timeout.connect(self._commit_language)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -54,11 +72,9 @@ class SettingsWidget(QWidget):
         lang_layout = QHBoxLayout(lang_group)
         lang_layout.addWidget(QLabel(t("settings.language_label")))
         self._lang_combo = QComboBox()
-        cur = current_language()
         for code, name in LANGUAGES.items():
             self._lang_combo.addItem(name, code)
-            if code == cur:
-                self._lang_combo.setCurrentIndex(self._lang_combo.count() - 1)
+        self._lang_combo.setCurrentIndex(list(LANGUAGES).index(current_language()))
         self._lang_combo.currentIndexChanged.connect(self._on_language_changed)
         lang_layout.addWidget(self._lang_combo)
         lang_layout.addStretch()
@@ -70,7 +86,7 @@ class SettingsWidget(QWidget):
 
         folder_row = QHBoxLayout()
         self._folder_label = QLabel(
-            self._settings.value("output_folder", t("settings.same_as_input"))
+            app_settings.value("output_folder", type=str) or t("settings.same_as_input")
         )
         self._folder_label.setProperty("class", "textSecondary")
         folder_row.addWidget(self._folder_label, 1)
@@ -127,10 +143,16 @@ class SettingsWidget(QWidget):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addWidget(scroll)
 
-        # Refresh status
-        self._refresh_lo_status()
         self._update_theme_button()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        # The tab lives for the whole session, so LibreOffice is looked up
+        # when it is shown rather than at startup. Within the cache TTL this
+        # is a settings read and a stat; a stale or vanished install is
+        # re-probed on a worker thread.
+        self._refresh_lo_status()
+
     def _toggle_theme(self):
         if self._theme_manager:
             self._theme_manager.toggle_theme()
@@ -145,9 +167,16 @@ class SettingsWidget(QWidget):
                 self._theme_btn.setText(t("settings.switch_dark"))
 
     def _on_language_changed(self, index: int):
+        self._lang_timer.start()
+
+    def _commit_language(self):
         code = self._lang_combo.currentData()
-        if code and code != current_language():
-            set_language(code)
+        # Compare with the saved choice, not just the running language, so
+        # switching back before a restart also undoes the saved change
+        if not code or code == app_settings.value("language", current_language()):
+            return
+        set_language(code)
+        if code != current_language():
             QMessageBox.information(
                 self, t("settings.restart_title"), t("settings.restart_msg"),
             )
@@ -155,34 +184,88 @@ class SettingsWidget(QWidget):
     def _browse_folder(self):
         folder = QFileDialog.getExistingDirectory(self, t("settings.select_folder"))
         if folder:
-            self._settings.setValue("output_folder", folder)
+            app_settings.set_value("output_folder", folder)
             self._folder_label.setText(folder)
 
     def _reset_folder(self):
-        self._settings.remove("output_folder")
+        app_settings.remove("output_folder")
         self._folder_label.setText(t("settings.same_as_input"))
 
-    def _refresh_lo_status(self):
-        lo = detect_libreoffice()
+    def _refresh_lo_status(self, force: bool = False):
+        if not force:
+            cached = self._cached_lo_info()
+            if cached:
+                self._show_lo_status(cached)
+                return
+
+        if self._lo_detector and self._lo_detector.isRunning():
+            return
+
+        from workers.libreoffice_detect_worker import LibreOfficeDetectWorker
+        self._lo_label.setText(t("settings.lo_checking"))
+        self._lo_detector = LibreOfficeDetectWorker(refresh=force, parent=self)
+        self._lo_detector.detected.connect(self._on_lo_detected)
+        self._lo_detector.start()
+
+    def _cached_lo_info(self):
+        """Return the last detected installation if it is recent and still on disk."""
+        path = app_settings.value("lo_cache_path", "")
+        timestamp = app_settings.value("lo_cache_ts", 0.0, type=float)
+        if not path or time.time() - timestamp > LO_CACHE_TTL_SECONDS:
+            return None
+        if not os.path.isfile(path):
+            return None
+
+        from core.utils import LibreOfficeInfo
+        return LibreOfficeInfo(
+            found=True, path=path,
+            version=app_settings.value("lo_cache_version", ""),
+        )
+
+    def _on_lo_detected(self, lo):
+        # Only a found installation is cached: the "not found" probe never
+        # launches soffice, and it must notice a fresh install right away.
+        if lo.found:
+            app_settings.set_value("lo_cache_path", lo.path)
+            app_settings.set_value("lo_cache_version", lo.version)
+            app_settings.set_value("lo_cache_ts", time.time())
+        else:
+            app_settings.remove("lo_cache_path", "lo_cache_version", "lo_cache_ts")
+        self._show_lo_status(lo)
+
+    def _show_lo_status(self, lo):
         if lo.found:
             version = lo.version.split('\n')[0] if lo.version else "unknown version"
             self._lo_label.setText(t("settings.lo_installed", version=version, path=lo.path))
-            self._lo_label.setProperty("class", "statusGreen")
+            set_class(self._lo_label, "statusGreen")
             self._lo_install_btn.hide()
             self._lo_auto_install_btn.hide()
         else:
             self._lo_label.setText(t("settings.lo_not_installed"))
-            self._lo_label.setProperty("class", "statusRed")
+            set_class(self._lo_label, "statusRed")
             self._lo_install_btn.show()
             self._lo_auto_install_btn.show()
+            # Load the install dialog's modules while idle so the first
+            # click on "Install automatically" opens it without a stall
+            QTimer.singleShot(0, _preload_install_dialog)
 
     def _auto_install_lo(self):
-        from ui.libreoffice_install_dialog import LibreOfficeInstallDialog
-        dialog = LibreOfficeInstallDialog(self)
-        dialog.install_completed.connect(lambda _: self._refresh_lo_status())
-        dialog.exec()
+        # Built once and reused: a fresh dialog per click would also stay
+        # parented to this widget for the rest of the session
+        if self._lo_dialog is None:
+            from ui.libreoffice_install_dialog import LibreOfficeInstallDialog
+            self._lo_dialog = LibreOfficeInstallDialog(self)
+            self._lo_dialog.install_completed.connect(
+                lambda _: self._refresh_lo_status(force=True)
+            )
+        self._lo_dialog.reset()
+        self._lo_dialog.exec()
 
     def _show_lo_instructions(self):
+        from core.utils import get_libreoffice_install_instructions
         instructions = get_libreoffice_install_instructions()
         QMessageBox.information(self, t("settings.lo_install_title"), instructions)
 
+    def cleanup(self):
+        if self._lo_detector:
+            self._lo_detector.wait(5000)
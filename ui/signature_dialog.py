@@ -4,13 +4,13 @@ import os
 import tempfile
 from typing import List, Optional, Tuple
 
-from PIL import Image, ImageDraw
+from PIL import Image
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QSlider, QComboBox, QFileDialog, QWidget, QTabWidget,
     QColorDialog,
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import (
     QImage, QPixmap, QMouseEvent, QPainter, QPen, QColor, QPainterPath,
 )
@@ -19,6 +19,23 @@ from core.page_manager import PageSource, PageManager, ImageAnnotation
 from i18n import t
 
 
+# PIL modes whose raw bytes QImage reads as is, with bytes per pixel
+_QIMAGE_FORMATS = {
+    "RGB": (QImage.Format.Format_RGB888, 3),
+    "RGBA": (QImage.Format.Format_RGBA8888, 4),
+}
+
+
+def _to_pixmap(img: Image.Image) -> QPixmap:
+    """Convert a PIL image to a QPixmap, converting pixels only if needed."""
+    if img.mode not in _QIMAGE_FORMATS:
+        img = img.convert("RGBA")
+    fmt, bpp = _QIMAGE_FORMATS[img.mode]
+    data = img.tobytes()
+    qimg = QImage(data, img.width, img.height, bpp * img.width, fmt)
+    return QPixmap.fromImage(qimg)
+
+
 # ---------------------------------------------------------------------------
 # Freehand signature drawing canvas
 # ---------------------------------------------------------------------------
@@ -43,16 +60,22 @@ class SignatureCanvas(QWidget):
         self._pen_color = QColor(0, 0, 0)
         self._pen_width = 3
         self._is_drawing = False
+        # Last to_pil_image() result; cleared whenever the strokes or the
+        # pen (which applies to every stroke) change
+        self._pil_cache: Optional[Image.Image] = None
 
     def set_pen_color(self, color: QColor):
         self._pen_color = color
+        self._pil_cache = None
 
     def set_pen_width(self, width: int):
         self._pen_width = width
+        self._pil_cache = None
 
     def clear(self):
         self._paths.clear()
         self._current_path = None
+        self._pil_cache = None
         self.update()
         self.signature_changed.emit()
 
@@ -60,12 +83,19 @@ class SignatureCanvas(QWidget):
         return len(self._paths) == 0
 
     def to_pil_image(self) -> Optional[Image.Image]:
-        """Render the signature to a PIL RGBA Image, cropped to content."""
+        """Render the signature to a PIL RGBA Image, cropped to content.
+
+        The image is cached until the strokes or pen change; callers must
+        not modify it.
+        """
         if self.is_empty():
             return None
+        if self._pil_cache is not None:
+            return self._pil_cache
 
-        # Render to QImage with alpha
-        qimg = QImage(self.size(), QImage.Format.Format_ARGB32)
+        # Render to QImage with alpha. RGBA8888 is laid out R, G, B, A in
+        # memory on every platform, matching PIL's "RGBA" mode byte for byte.
+        qimg = QImage(self.size(), QImage.Format.Format_RGBA8888)
         qimg.fill(Qt.GlobalColor.transparent)
 
         painter = QPainter(qimg)
@@ -78,21 +108,13 @@ class SignatureCanvas(QWidget):
             painter.drawPath(path)
         painter.end()
 
-        # Convert QImage → PIL Image
-        # QImage Format_ARGB32: each pixel is 0xAARRGGBB (native endian)
+        # Convert QImage → PIL Image. With matching layouts frombuffer wraps
+        # qimg's memory without copying; the crop below copies out the
+        # content before qimg is released.
         w, h = qimg.width(), qimg.height()
-        ptr = qimg.bits()
-        ptr.setsize(w * h * 4)
-        raw = bytes(ptr)
-
-        # Convert BGRA → RGBA (Qt stores as BGRA on little-endian)
-        rgba_data = bytearray(len(raw))
-        for i in range(0, len(raw), 4):
-            rgba_data[i] = raw[i + 2]      # R
-            rgba_data[i + 1] = raw[i + 1]  # G
-            rgba_data[i + 2] = raw[i]      # B
-            rgba_data[i + 3] = raw[i + 3]  # A
-        pil_img = Image.frombytes("RGBA", (w, h), bytes(rgba_data))
+        ptr = qimg.constBits()
+        ptr.setsize(qimg.sizeInBytes())
+        pil_img = Image.frombuffer("RGBA", (w, h), ptr, "raw", "RGBA", 0, 1)
 
         # Crop to content bounding box
         bbox = pil_img.getbbox()
@@ -105,7 +127,8 @@ class SignatureCanvas(QWidget):
             min(w, bbox[2] + pad),
             min(h, bbox[3] + pad),
         )
-        return pil_img.crop(crop_box)
+        self._pil_cache = pil_img.crop(crop_box)
+        return self._pil_cache
 
     def mousePressEvent(self, event: QMouseEvent):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -125,6 +148,7 @@ class SignatureCanvas(QWidget):
             if self._current_path is not None:
                 self._paths.append(self._current_path)
                 self._current_path = None
+                self._pil_cache = None
             self.update()
             self.signature_changed.emit()
 
@@ -202,10 +226,21 @@ class SignatureDialog(QDialog):
         self._pos_y: float = 0.82
         self._scale: float = 0.25
         self._signature_img: Optional[Image.Image] = None
-        self._base_img: Optional[Image.Image] = None
+        self._base_pixmap: Optional[QPixmap] = None
+        # ((label w, h), page pixmap scaled to fit) for the preview
+        self._display_base_cache: Optional[Tuple[Tuple[int, int], QPixmap]] = None
+        # (signature, source pixmap, (w, h), scaled pixmap) for the preview
+        self._preview_sig_cache: Optional[
+            Tuple[Image.Image, QPixmap, Tuple[int, int], QPixmap]
+        ] = None
         self._result: Optional[ImageAnnotation] = None
         self._temp_path: str = ""
 
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(16)
+        self._preview_timer.timeout.connect(self._update_preview)
+
         self._setup_ui()
         self._load_preview()
 
@@ -342,7 +377,9 @@ class SignatureDialog(QDialog):
         layout.addLayout(btn_row)
 
     def _load_preview(self):
-        self._base_img = self._manager.render_full_page(self._source, max_width=500)
+        self._base_pixmap = _to_pixmap(
+            self._manager.render_full_page(self._source, max_width=500)
+        )
         self._update_preview()
 
     # ------------------------------------------------------------------ Draw tab handlers
@@ -382,11 +419,7 @@ class SignatureDialog(QDialog):
             # Show a small preview of the uploaded image
             thumb = self._signature_img.copy()
             thumb.thumbnail((300, 100))
-            thumb_rgb = thumb.convert("RGB")
-            data = thumb_rgb.tobytes()
-            qimg = QImage(data, thumb_rgb.width, thumb_rgb.height,
-                          3 * thumb_rgb.width, QImage.Format.Format_RGB888)
-            self._upload_preview.setPixmap(QPixmap.fromImage(qimg))
+            self._upload_preview.setPixmap(_to_pixmap(thumb))
             self._apply_btn.setEnabled(True)
             self._update_preview()
         except Exception:
@@ -422,7 +455,11 @@ class SignatureDialog(QDialog):
     def _on_scale_changed(self, value: int):
         self._scale = value / 100.0
         self._scale_label.setText(f"{value}%")
-        self._update_preview()
+        # A slider drag fires once per step; render at most once per frame.
+        # Not restarted while pending, so a steady drag still updates the
+        # preview as it goes; the render reads the latest value.
+        if not self._preview_timer.isActive():
+            self._preview_timer.start()
 
     # ------------------------------------------------------------------ Preview rendering
 
@@ -432,44 +469,79 @@ class SignatureDialog(QDialog):
         return 0.5
 
     def _update_preview(self):
-        if self._base_img is None:
+        if self._base_pixmap is None:
             return
 
-        img = self._base_img.copy().convert("RGBA")
+        # Compose at display size: the page is scaled once per preview size,
+        # and the signature and crosshair are painted onto a copy of that
+        composed = QPixmap(self._display_base())
+        w, h = composed.width(), composed.height()
+        painter = QPainter(composed)
 
         if self._signature_img is not None:
-            ow = int(img.width * self._scale)
+            ow = int(w * self._scale)
             aspect = self._get_aspect()
             oh = int(ow * aspect)
             if ow > 0 and oh > 0:
-                resized = self._signature_img.resize((ow, oh), Image.Resampling.LANCZOS)
-                px = int(self._pos_x * img.width)
-                py = int(self._pos_y * img.height)
-                px = max(0, min(px, img.width - ow))
-                py = max(0, min(py, img.height - oh))
-                img.paste(resized, (px, py), resized)
+                px = int(self._pos_x * w)
+                py = int(self._pos_y * h)
+                px = max(0, min(px, w - ow))
+                py = max(0, min(py, h - oh))
+                painter.drawPixmap(px, py, self._preview_signature(ow, oh))
 
         # Draw crosshair at position
-        draw = ImageDraw.Draw(img)
-        cx = int(self._pos_x * img.width)
-        cy = int(self._pos_y * img.height)
-        draw.line([(cx - 12, cy), (cx + 12, cy)], fill=(255, 0, 0), width=2)
-        draw.line([(cx, cy - 12), (cx, cy + 12)], fill=(255, 0, 0), width=2)
-
-        final = img.convert("RGB")
-        self._set_pixmap(final)
-
-    def _set_pixmap(self, img: Image.Image):
-        data = img.tobytes()
-        qimg = QImage(data, img.width, img.height, 3 * img.width,
-                       QImage.Format.Format_RGB888)
-        pixmap = QPixmap.fromImage(qimg)
-        scaled = pixmap.scaled(
-            self._preview.width(), self._preview.height(),
-            Qt.AspectRatioMode.KeepAspectRatio,
+        cx = int(self._pos_x * w)
+        cy = int(self._pos_y * h)
+        painter.setPen(QPen(QColor(255, 0, 0), 2))
+        painter.drawLine(cx - 12, cy, cx + 12, cy)
+        painter.drawLine(cx, cy - 12, cx, cy + 12)
+        painter.end()
+
+        self._preview.setPixmap(composed)
+
+    def _display_base(self) -> QPixmap:
+        """Return the page pixmap smooth-scaled to fit the preview label."""
+        size = (self._preview.width(), self._preview.height())
+        if self._display_base_cache is None or self._display_base_cache[0] != size:
+            scaled = self._base_pixmap.scaled(
+                size[0], size[1],
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            self._display_base_cache = (size, scaled)
+        return self._display_base_cache[1]
+
+    def _preview_signature(self, ow: int, oh: int) -> QPixmap:
+        """Return the signature scaled to (ow, oh) for the preview.
+
+        Clicks and position presets keep the size, so only a new signature
+        or a scale change rescales. The preview never shows the signature
+        wider than the largest scale allows, so an uploaded image is reduced
+        to that once, and later scales start from the smaller copy.
+        """
+        sig = self._signature_img
+        cache = self._preview_sig_cache
+        if cache is not None and cache[0] is sig:
+            if cache[2] == (ow, oh):
+                return cache[3]
+            source = cache[1]
+        else:
+            max_w = int(self._base_pixmap.width() * self._scale_slider.maximum() / 100)
+            if sig.width > max_w > 0:
+                sig_img = sig.resize(
+                    (max_w, max(1, round(sig.height * max_w / sig.width))),
+                    Image.Resampling.LANCZOS,
+                )
+            else:
+                sig_img = sig
+            source = _to_pixmap(sig_img)
+        scaled = source.scaled(
+            ow, oh,
+            Qt.AspectRatioMode.IgnoreAspectRatio,
             Qt.TransformationMode.SmoothTransformation,
         )
-        self._preview.setPixmap(scaled)
+        self._preview_sig_cache = (sig, source, (ow, oh), scaled)
+        return scaled
 
     # ------------------------------------------------------------------ Apply
 
@@ -480,7 +552,9 @@ class SignatureDialog(QDialog):
         # Save signature to a temp PNG file
         temp_dir = tempfile.gettempdir()
         self._temp_path = os.path.join(temp_dir, f"localpdf_sig_{id(self)}.png")
-        self._signature_img.save(self._temp_path, "PNG")
+        # Fast zlib level: the file is only read back (for previews, and by
+        # MuPDF, which decodes it and compresses the image itself on insert)
+        self._signature_img.save(self._temp_path, "PNG", compress_level=1)
 
         aspect = self._get_aspect()
         norm_height = self._scale * aspect
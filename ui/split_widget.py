@@ -23,6 +23,7 @@ class SplitWidget(QWidget):
         super().__init__(parent)
         self._current_file = ""
         self._page_count = 0
+        self._input_size = 0  # From validation; sizes the disk space check
         self._worker: SplitWorker = None
         self._setup_ui()
         self._connect_signals()
@@ -112,6 +113,7 @@ class SplitWidget(QWidget):
 
         self._current_file = file_path
         self._page_count = result.page_count
+        self._input_size = result.file_size_bytes
         self._page_info.setText(t("split.pages_info", count=result.page_count))
         self._page_info.show()
         self._result_card.reset()
@@ -121,6 +123,7 @@ class SplitWidget(QWidget):
     def _on_file_removed(self):
         self._current_file = ""
         self._page_count = 0
+        self._input_size = 0
         self._page_info.hide()
         self._extract_btn.setEnabled(False)
         self._result_card.reset()
@@ -128,7 +131,9 @@ class SplitWidget(QWidget):
 
     def _update_button_state(self):
         has_file = bool(self._current_file)
-        has_range = bool(self._range_input.text().strip())
+        text = self._range_input.text()
+        # isspace() stops at the first visible character; strip() would copy
+        has_range = bool(text) and not text.isspace()
         self._extract_btn.setEnabled(has_file and has_range)
 
     def _on_extract_clicked(self):
@@ -147,7 +152,7 @@ class SplitWidget(QWidget):
         if split_individual:
             output_dir = os.path.dirname(self._current_file)
             has_space, space_msg = check_disk_space(
-                output_dir, os.path.getsize(self._current_file),
+                output_dir, self._input_size,
             )
             if not has_space:
                 QMessageBox.warning(self, t("common.disk_space"), space_msg)
@@ -163,7 +168,7 @@ class SplitWidget(QWidget):
         else:
             output_path = get_output_path(self._current_file, suffix="_extracted")
             has_space, space_msg = check_disk_space(
-                os.path.dirname(output_path), os.path.getsize(self._current_file),
+                os.path.dirname(output_path), self._input_size,
             )
             if not has_space:
                 QMessageBox.warning(self, t("common.disk_space"), space_msg)
@@ -181,14 +186,10 @@ class SplitWidget(QWidget):
         self._result_card.reset()
         self._progress.start()
 
-        self._worker.progress.connect(self._on_progress)
         self._worker.finished.connect(self._on_split_finished)
         self._worker.error.connect(self._on_split_error)
         self._worker.start()
-
-    def _on_progress(self, step: int, total: int, message: str):
-        pct = int(step / total * 100) if total > 0 else 0
-        self._progress.update_progress(pct, 100, message)
+        self._progress.track(self._worker)
 
     def _on_split_finished(self, result):
         self._progress.finish()
@@ -234,6 +235,7 @@ class SplitWidget(QWidget):
         self._split_check.setChecked(False)
         self._current_file = ""
         self._page_count = 0
+        self._input_size = 0
         self._page_info.hide()
         self._extract_btn.setEnabled(False)
 
@@ -2,11 +2,25 @@
 
 import sys
 from pathlib import Path
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QSettings
+from typing import Dict
+from PyQt6.QtWidgets import QApplication, QWidget
 from PyQt6.QtGui import QFont
 
 from core.utils import get_asset_path
+import app_settings
+
+
+def set_class(widget: QWidget, cls: str):
+    """Set the QSS class of an already-styled widget.
+
+    A class change after the widget is polished needs a re-polish to take
+    effect; both are skipped when the class is unchanged.
+    """
+    if widget.property("class") == cls:
+        return
+    widget.setProperty("class", cls)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
 
 
 class ThemeManager:
@@ -15,10 +29,13 @@ class ThemeManager:
     LIGHT = "light"
     DARK = "dark"
 
+    # Stylesheet text by file name; read from disk once per run
+    _qss_cache: Dict[str, str] = {}
+
     def __init__(self, app: QApplication):
         self._app = app
-        self._settings = QSettings("Svetozar Technologies", "LocalPDF")
-        self._current_theme = self._settings.value("theme", self.LIGHT)
+        self._applied_qss = None
+        self._current_theme = app_settings.value("theme", self.LIGHT)
         self._setup_font()
 
     def _setup_font(self):
@@ -34,11 +51,17 @@ class ThemeManager:
 
     def apply_theme(self, theme: str = None):
         """Load and apply the QSS file for the given theme."""
+        # Already showing this theme: nothing to load, apply or save
+        if self._applied_qss is not None and theme in (None, self._current_theme):
+            return
         if theme:
             self._current_theme = theme
         qss = self._load_qss(f"{self._current_theme}.qss")
-        self._app.setStyleSheet(qss)
-        self._settings.setValue("theme", self._current_theme)
+        # setStyleSheet re-polishes every widget, even for identical text
+        if qss != self._applied_qss:
+            self._app.setStyleSheet(qss)
+            self._applied_qss = qss
+        app_settings.set_value("theme", self._current_theme)
 
     def toggle_theme(self) -> str:
         """Switch between light and dark. Returns new theme name."""
@@ -49,12 +72,16 @@ class ThemeManager:
     def current_theme(self) -> str:
         return self._current_theme
 
-    @staticmethod
-    def _load_qss(filename: str) -> str:
+    @classmethod
+    def _load_qss(cls, filename: str) -> str:
         """Read QSS file from assets/styles/ directory."""
-        qss_path = get_asset_path(f"assets/styles/{filename}")
-        try:
-            with open(qss_path, "r") as f:
-                return f.read()
-        except FileNotFoundError:
-            return ""
+        qss = cls._qss_cache.get(filename)
+        if qss is None:
+            qss_path = get_asset_path(f"assets/styles/{filename}")
+            try:
+                with open(qss_path, "r") as f:
+                    qss = f.read()
+            except FileNotFoundError:
+                qss = ""
+            cls._qss_cache[filename] = qss
+        return qss
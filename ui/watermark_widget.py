@@ -1,34 +1,74 @@
 """PDF Watermark tab widget."""
 
-import io
 import os
-import fitz
-from PIL import Image as PILImage, ImageEnhance
+from typing import Optional
+from PIL import Image as PILImage
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMessageBox,
     QScrollArea, QGroupBox, QRadioButton, QButtonGroup, QLineEdit,
     QComboBox, QSpinBox, QDoubleSpinBox, QSlider, QFileDialog,
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QImage, QPixmap
 
 from ui.components.drop_zone import DropZone
 from ui.components.progress_widget import ProgressWidget
 from ui.components.result_card import ResultCard
-from workers.watermark_worker import WatermarkWorker
+from workers.watermark_worker import WatermarkWorker, PreviewSourceWorker
 from core.watermark import TextWatermarkConfig, ImageWatermarkConfig
 from core.utils import validate_pdf, get_output_path, check_disk_space
 from i18n import t
 
+# Bounds for the preview page width, in device pixels
+PREVIEW_MIN_WIDTH = 200
+PREVIEW_MAX_WIDTH = 900
+
 
 class WatermarkWidget(QWidget):
     """PDF Watermark tab: add text or image watermarks to PDFs."""
 
+    # Combo entries in display order; the combos are filled from these, so
+    # currentIndex() maps straight back to the value
+    _COLORS = (
+        ("gray", (0.5, 0.5, 0.5)),
+        ("red", (0.8, 0.1, 0.1)),
+        ("blue", (0.1, 0.1, 0.8)),
+        ("green", (0.1, 0.5, 0.1)),
+        ("black", (0.0, 0.0, 0.0)),
+    )
+    _POSITIONS = (
+        ("center", "center"),
+        ("top_left", "top-left"),
+        ("top_right", "top-right"),
+        ("bottom_left", "bottom-left"),
+        ("bottom_right", "bottom-right"),
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._current_file = ""
         self._watermark_image = ""
         self._worker: WatermarkWorker = None
+        # Preview inputs that the scale/opacity/position controls don't
+        # change: ((pdf path, width), page 1 render, zoom) and
+        # (image path, decoded RGBA watermark), loaded by PreviewSourceWorker;
+        # the page is prefetched as soon as a PDF is selected
+        self._preview_base = None
+        self._preview_wm = None
+        # ((width, height), watermark resized to that): opacity and position
+        # changes reuse it
+        self._preview_wm_scaled = None
+        # Loads in flight, as (generation, page key or image path)
+        self._preview_generation = 0
+        self._page_loading = None
+        self._wm_loading = None
+        # Spin box arrows and typing fire once per step; coalesce them
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(80)
+        self._preview_timer.timeout.connect(self._do_update_preview)
+        # Set when a control changed while the preview wasn't on screen
+        self._preview_stale = False
         self._setup_ui()
         self._connect_signals()
 
@@ -116,7 +156,7 @@ class WatermarkWidget(QWidget):
         row4 = QHBoxLayout()
         row4.addWidget(QLabel(t("watermark.color")))
         self._color_combo = QComboBox()
-        for key in ("gray", "red", "blue", "green", "black"):
+        for key, _ in self._COLORS:
             self._color_combo.addItem(t(f"color.{key}"), key)
         row4.addWidget(self._color_combo)
         row4.addStretch()
@@ -159,7 +199,7 @@ class WatermarkWidget(QWidget):
         img_row3 = QHBoxLayout()
         img_row3.addWidget(QLabel(t("watermark.position")))
         self._position_combo = QComboBox()
-        for key in ("center", "top_left", "top_right", "bottom_left", "bottom_right"):
+        for key, _ in self._POSITIONS:
             self._position_combo.addItem(t(f"position.{key}"), key)
         img_row3.addWidget(self._position_combo)
         img_row3.addStretch()
@@ -213,7 +253,7 @@ class WatermarkWidget(QWidget):
         self._img_select_btn.clicked.connect(self._select_image)
         self._img_scale_spin.valueChanged.connect(self._update_preview)
         self._img_opacity_spin.valueChanged.connect(self._update_preview)
-        self._position_combo.currentIndexChanged.connect(self._update_preview)
+        self._position_combo.currentIndexChanged.connect(self._refresh_preview)
         self._watermark_btn.clicked.connect(self._on_watermark_clicked)
         self._progress.cancel_clicked.connect(self._on_cancel_clicked)
         self._result_card.compress_another.connect(self._on_another)
@@ -225,7 +265,7 @@ class WatermarkWidget(QWidget):
         else:
             self._text_options.hide()
             self._image_options.show()
-            self._update_preview()
+            self._refresh_preview()
 
     def _select_image(self):
         path, _ = QFileDialog.getOpenFileName(
@@ -234,8 +274,11 @@ class WatermarkWidget(QWidget):
         )
         if path:
             self._watermark_image = path
+            # Re-read even if the same file was picked again; the page
+            # render stays
+            self._discard_preview_sources(page=False, image=True)
             self._img_path_label.setText(os.path.basename(path))
-            self._update_preview()
+            self._refresh_preview()
 
     def _on_file_selected(self, file_path: str):
         result = validate_pdf(file_path)
@@ -248,64 +291,174 @@ class WatermarkWidget(QWidget):
         self._watermark_btn.setEnabled(True)
         self._result_card.reset()
         self._progress.reset()
-        self._update_preview()
+        self._prefetch_preview_page()
+        self._refresh_preview()
 
     def _on_file_removed(self):
         self._current_file = ""
+        self._discard_preview_sources()
         self._watermark_btn.setEnabled(False)
         self._result_card.reset()
         self._progress.reset()
 
     def _get_color_tuple(self) -> tuple:
-        color_map = {
-            "gray": (0.5, 0.5, 0.5),
-            "red": (0.8, 0.1, 0.1),
-            "blue": (0.1, 0.1, 0.8),
-            "green": (0.1, 0.5, 0.1),
-            "black": (0.0, 0.0, 0.0),
-        }
-        return color_map.get(self._color_combo.currentData(), (0.5, 0.5, 0.5))
+        index = self._color_combo.currentIndex()
+        return self._COLORS[index][1] if index >= 0 else self._COLORS[0][1]
 
     def _get_position_str(self) -> str:
-        pos_map = {
-            "center": "center",
-            "top_left": "top-left",
-            "top_right": "top-right",
-            "bottom_left": "bottom-left",
-            "bottom_right": "bottom-right",
-        }
-        return pos_map.get(self._position_combo.currentData(), "center")
+        index = self._position_combo.currentIndex()
+        return self._POSITIONS[index][1] if index >= 0 else self._POSITIONS[0][1]
 
     def _update_preview(self):
+        if not self._image_radio.isChecked():
+            return
+        if not self._image_options.isVisible():
+            # Another tab is showing; catch up when this one is shown
+            self._preview_stale = True
+            return
+        self._preview_timer.start()
+
+    def _refresh_preview(self):
+        """Update the preview right away, for discrete changes (file, image, mode, position)."""
+        self._preview_timer.stop()
+        self._do_update_preview()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._preview_stale:
+            self._preview_stale = False
+            self._refresh_preview()
+
+    def _preview_width(self) -> int:
+        """Width to render the preview page at: the label's, in device pixels."""
+        label = self._preview_label
+        width = label.contentsRect().width()
+        if not label.isVisible():
+            # Not laid out while text mode is showing; the image options box
+            # gets the same width as the text options box it replaces
+            margins = self._image_options.layout().contentsMargins()
+            frame = label.width() - width
+            width = (self._text_options.contentsRect().width()
+                     - margins.left() - margins.right() - frame)
+        return max(PREVIEW_MIN_WIDTH, min(PREVIEW_MAX_WIDTH, int(
+            width * self.devicePixelRatioF()
+        )))
+
+    def _load_preview_source(self, pdf_path: Optional[str], width: int,
+                             image_path: Optional[str]):
+        """Render the page or decode the watermark on a worker thread."""
+        self._preview_generation += 1
+        if pdf_path:
+            self._page_loading = (self._preview_generation, (pdf_path, width))
+        else:
+            self._wm_loading = (self._preview_generation, image_path)
+        loader = PreviewSourceWorker(
+            self._preview_generation, pdf_path, width, image_path,
+            image_max_width=PREVIEW_MAX_WIDTH, parent=self,
+        )
+        loader.loaded.connect(self._on_preview_source_loaded)
+        loader.error.connect(self._on_preview_source_error)
+        loader.finished.connect(loader.deleteLater)
+        loader.start()
+
+    def _page_render_fits(self, key, width: int) -> bool:
+        """Whether a page render keyed (pdf path, width) can serve this width.
+
+        Any render of the current file at least this wide will do; the
+        pixmap is scaled down to the label. The estimate made while text
+        mode is showing can't know whether image mode brings in a
+        scroll bar, so an exact-width match would render the page twice.
+        """
+        return key[0] == self._current_file and key[1] >= width
+
+    def _prefetch_preview_page(self):
+        """Start rendering the preview page before image mode is chosen."""
+        width = self._preview_width()
+        if self._preview_base is not None and self._page_render_fits(self._preview_base[0], width):
+            return
+        if self._page_loading is not None and self._page_render_fits(self._page_loading[1], width):
+            return
+        self._load_preview_source(self._current_file, width, None)
+
+    def _on_preview_source_loaded(self, generation, pdf_path, width, base, zoom,
+                                  image_path, wm):
+        # Results of superseded or discarded loads are dropped
+        if base is not None and self._page_loading and self._page_loading[0] == generation:
+            self._page_loading = None
+            self._preview_base = ((pdf_path, width), base, zoom)
+        elif wm is not None and self._wm_loading and self._wm_loading[0] == generation:
+            self._wm_loading = None
+            self._preview_wm = (image_path, wm)
+            self._preview_wm_scaled = None
+        else:
+            return
+        self._do_update_preview()
+
+    def _on_preview_source_error(self, generation: int, error_msg: str):
+        for attr in ("_page_loading", "_wm_loading"):
+            loading = getattr(self, attr)
+            if loading is not None and loading[0] == generation:
+                setattr(self, attr, None)
+                self._preview_label.setText(f"Preview error: {error_msg}")
+
+    def _discard_preview_sources(self, page: bool = True, image: bool = False):
+        if page:
+            self._page_loading = None
+            self._preview_base = None
+        if image:
+            self._wm_loading = None
+            self._preview_wm = None
+            self._preview_wm_scaled = None
+
+    def _do_update_preview(self):
         """Render a live preview of the image watermark on page 1."""
         if not self._current_file or not self._watermark_image or not self._image_radio.isChecked():
             return
+        if not self._image_options.isVisible():
+            self._preview_stale = True
+            return
+
+        # Load whichever input is missing and not already on its way; its
+        # arrival calls back in here
+        page_width = self._preview_width()
+        need_page = (self._preview_base is None
+                     or not self._page_render_fits(self._preview_base[0], page_width))
+        need_wm = self._preview_wm is None or self._preview_wm[0] != self._watermark_image
+        if need_page and (self._page_loading is None
+                          or not self._page_render_fits(self._page_loading[1], page_width)):
+            self._load_preview_source(self._current_file, page_width, None)
+        if need_wm and (self._wm_loading is None or self._wm_loading[1] != self._watermark_image):
+            self._load_preview_source(None, 0, self._watermark_image)
+        if need_page or need_wm:
+            return
+        _, base, zoom = self._preview_base
+        _, wm = self._preview_wm
+        dpr = self.devicePixelRatioF()
 
         try:
-            # Render page 1 of the PDF
-            doc = fitz.open(self._current_file)
-            page = doc[0]
-            preview_width = 450
-            zoom = preview_width / page.rect.width
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat)
-            base = PILImage.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            doc.close()
-
-            # Open and scale watermark image
-            wm = PILImage.open(self._watermark_image).convert("RGBA")
+            # Scale watermark image
             scale = self._img_scale_spin.value()
             wm_w = int(base.width * scale)
             wm_h = int(wm_w * wm.height / wm.width)
             if wm_w < 1 or wm_h < 1:
                 return
-            wm = wm.resize((wm_w, wm_h), PILImage.LANCZOS)
-
-            # Apply opacity to alpha channel
+            if self._preview_wm_scaled is None or self._preview_wm_scaled[0] != (wm_w, wm_h):
+                # Preview only: Qt shows it at screen size, so bilinear is
+                # indistinguishable here. WatermarkWorker embeds the original.
+                self._preview_wm_scaled = (
+                    (wm_w, wm_h), wm.resize((wm_w, wm_h), PILImage.BILINEAR),
+                )
+            wm = self._preview_wm_scaled[1]
+
+            # Opacity scales the paste mask, not the cached image's alpha
+            # (always RGBA, the loader converts it); at full opacity the
+            # alpha is used as decoded
             opacity = self._img_opacity_spin.value()
-            alpha = wm.split()[3]
-            alpha = ImageEnhance.Brightness(alpha).enhance(opacity)
-            wm.putalpha(alpha)
+            mask = wm
+            if opacity < 1.0:
+                # point() scales through a 256-entry lookup table in one pass;
+                # ImageEnhance.Brightness would blend with a black image
+                mask = wm.getchannel("A").point(lambda a: a * opacity)
 
             # Calculate position (same logic as PDFWatermarker._get_position)
             position = self._get_position_str()
@@ -322,19 +475,22 @@ class WatermarkWidget(QWidget):
             else:  # center
                 x, y = (bw - wm_w) // 2, (bh - wm_h) // 2
 
-            # Composite
-            base = base.convert("RGBA")
-            base.paste(wm, (x, y), wm)
-            result = base.convert("RGB")
+            # Composite. paste() blends the alpha channel too, so under the
+            # watermark the result's alpha drops below 255
+            result = base.copy()
+            result.paste(wm, (x, y), mask)
 
-            # Convert to QPixmap
-            buf = io.BytesIO()
-            result.save(buf, format="PNG")
-            qimg = QImage()
-            qimg.loadFromData(buf.getvalue())
+            # Convert to QPixmap straight from the pixel buffer; RGBX ignores
+            # that alpha byte, so the preview stays opaque like the page
+            data = result.tobytes()
+            qimg = QImage(data, result.width, result.height, 4 * result.width,
+                          QImage.Format.Format_RGBX8888)
             pixmap = QPixmap.fromImage(qimg)
+            # A wider render than needed is drawn scaled down to the label
+            ratio = dpr * bw / page_width
+            pixmap.setDevicePixelRatio(ratio)
             self._preview_label.setPixmap(pixmap)
-            self._preview_label.setMinimumHeight(pixmap.height())
+            self._preview_label.setMinimumHeight(int(pixmap.height() / ratio))
 
         except Exception as e:
             self._preview_label.setText(f"Preview error: {e}")
@@ -388,13 +544,10 @@ class WatermarkWidget(QWidget):
             text_config=text_config,
             image_config=image_config,
         )
-        self._worker.progress.connect(self._on_progress)
         self._worker.finished.connect(self._on_finished)
         self._worker.error.connect(self._on_error)
         self._worker.start()
-
-    def _on_progress(self, step: int, total: int, message: str):
-        self._progress.update_progress(step, total, message)
+        self._progress.track(self._worker)
 
     def _on_finished(self, result):
         self._progress.finish()
@@ -430,12 +583,15 @@ class WatermarkWidget(QWidget):
         self._progress.reset()
         self._current_file = ""
         self._watermark_image = ""
+        self._discard_preview_sources(image=True)
         self._img_path_label.setText(t("watermark.no_image"))
         self._preview_label.setText(t("watermark.preview_placeholder"))
         self._preview_label.setPixmap(QPixmap())
         self._watermark_btn.setEnabled(False)
 
     def cleanup(self):
+        for loader in self.findChildren(PreviewSourceWorker):
+            loader.wait(5000)
         if self._worker and self._worker.isRunning():
             self._worker.cancel()
             if not self._worker.wait(5000):
@@ -1,13 +1,23 @@
 """Background worker for batch PDF compression."""
 
 import os
+from concurrent.futures import FIRST_COMPLETED, wait
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Optional
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from core.compressor import PDFCompressor, CompressionConfig
-from core.utils import get_output_path, format_file_size
+from core.compressor import (
+    PDFCompressor, CompressionConfig, CompressionResult,
+    init_compress_process, compress_in_process,
+)
+from core.utils import (
+    get_output_path, format_file_size, default_process_count, process_context, process_pool,
+)
+
+# Upper bound on compression processes: each holds a whole PDF and its
+# re-encoded images in memory, and they share one output disk
+MAX_COMPRESS_PROCESSES = 4
 
 
 @dataclass
@@ -32,7 +42,7 @@ class BatchCompressResult:
 
 
 class BatchCompressWorker(QThread):
-    """Compresses multiple PDFs in sequence."""
+    """Compresses multiple PDFs, several at a time on multi-core machines."""
 
     progress = pyqtSignal(int, int, str)
     file_started = pyqtSignal(int, str)
@@ -44,12 +54,18 @@ class BatchCompressWorker(QThread):
         self,
         file_paths: List[str],
         target_size_bytes: int,
+        workers: Optional[int] = None,
         parent=None,
     ):
         super().__init__(parent)
         self._file_paths = file_paths
         self._target_size_bytes = target_size_bytes
+        # Compression processes; None or 0 = one per core (less one kept free
+        # for the UI, at most MAX_COMPRESS_PROCESSES), 1 = one file at a time
+        # on this thread
+        self._workers = workers
         self._cancelled = False
+        self._cancel_event = None
         self._compressor = PDFCompressor()
 
     def run(self):
@@ -63,66 +79,15 @@ class BatchCompressWorker(QThread):
         batch_result.output_folder = output_dir
 
         try:
-            for i, path in enumerate(self._file_paths):
-                if self._cancelled:
-                    break
-
-                name = os.path.basename(path)
-                self.file_started.emit(i, name)
-
-                # Save to compressed/ subfolder with original filename
-                output_path = os.path.join(output_dir, name)
-                # Avoid overwriting if same name exists
-                if os.path.exists(output_path):
-                    stem, ext = os.path.splitext(name)
-                    counter = 1
-                    while os.path.exists(output_path):
-                        output_path = os.path.join(output_dir, f"{stem}({counter}){ext}")
-                        counter += 1
-
-                config = CompressionConfig(
-                    input_path=path,
-                    output_path=output_path,
-                    target_size_bytes=self._target_size_bytes,
-                )
-
-                try:
-                    result = self._compressor.compress(
-                        config,
-                        on_progress=lambda s, t, m, idx=i: self._on_file_progress(idx, s, t, m),
-                        is_cancelled=self._is_cancelled,
-                    )
-                    if self._cancelled:
-                        break
-
-                    file_result = BatchFileResult(
-                        path=path,
-                        success=result.success,
-                        original_size=result.original_size,
-                        compressed_size=result.compressed_size,
-                        output_path=result.output_path if result.success else "",
-                        error_message=result.error_message,
-                    )
-                except Exception as e:
-                    file_result = BatchFileResult(
-                        path=path, success=False, error_message=str(e),
-                    )
-
-                if not self._cancelled:
-                    self.file_finished.emit(i, file_result)
-                    batch_result.file_results.append(file_result)
-                    if file_result.success:
-                        batch_result.succeeded += 1
-                        batch_result.total_original_size += file_result.original_size
-                        batch_result.total_compressed_size += file_result.compressed_size
-                    else:
-                        batch_result.failed += 1
-
-                    overall_pct = int((i + 1) / total * 100)
-                    self.progress.emit(
-                        overall_pct, 100,
-                        f"Completed {i + 1}/{total} files",
-                    )
+            jobs = self._plan_jobs(output_dir)
+            num_processes = min(
+                self._workers or min(default_process_count(), MAX_COMPRESS_PROCESSES),
+                total,
+            )
+            if num_processes > 1:
+                self._compress_in_processes(jobs, num_processes, batch_result)
+            else:
+                self._compress_in_thread(jobs, batch_result)
 
             if not self._cancelled:
                 self.finished.emit(batch_result)
@@ -131,11 +96,130 @@ class BatchCompressWorker(QThread):
             if not self._cancelled:
                 self.error.emit(f"Batch compression error: {str(e)}")
 
+    def _plan_jobs(self, output_dir: str) -> list:
+        """Pick each file's output path up front as (index, CompressionConfig).
+
+        Files run concurrently, so two inputs with the same name must not be
+        handed the same output path before either has been written. The
+        folder is listed once rather than probed per candidate name (slow
+        on network drives); names are compared casefolded, since macOS and
+        Windows file systems ignore case.
+        """
+        jobs = []
+        taken = {name.casefold() for name in os.listdir(output_dir)}
+        for i, path in enumerate(self._file_paths):
+            # Save to compressed/ subfolder with original filename
+            name = os.path.basename(path)
+            # Avoid overwriting if same name exists
+            if name.casefold() in taken:
+                stem, ext = os.path.splitext(name)
+                counter = 1
+                while name.casefold() in taken:
+                    name = f"{stem}({counter}){ext}"
+                    counter += 1
+            taken.add(name.casefold())
+            jobs.append((i, CompressionConfig(
+                input_path=path,
+                output_path=os.path.join(output_dir, name),
+                target_size_bytes=self._target_size_bytes,
+            )))
+        return jobs
+
+    def _compress_in_thread(self, jobs: list, batch_result: BatchCompressResult):
+        """Compress the files one after another on this thread."""
+        for i, config in jobs:
+            if self._cancelled:
+                return
+            self.file_started.emit(i, os.path.basename(config.input_path))
+            try:
+                # Per-file progress is not surfaced to the overall progress bar
+                result = self._compressor.compress(config, is_cancelled=self._is_cancelled)
+                file_result = self._file_result(config.input_path, result)
+            except Exception as e:
+                file_result = BatchFileResult(
+                    path=config.input_path, success=False, error_message=str(e),
+                )
+            if self._cancelled:
+                return
+            self._record(i, file_result, batch_result)
+
+    def _compress_in_processes(self, jobs: list, num_processes: int,
+                               batch_result: BatchCompressResult):
+        """Compress up to num_processes files at a time, one per process.
+
+        Compression is MuPDF and Pillow work that mostly holds the GIL, so
+        threads would take turns; processes run on separate cores. Files are
+        submitted only as processes free up, so file_started still marks the
+        files actually being worked on.
+        """
+        self._cancel_event = process_context().Event()
+        if self._cancelled:
+            return
+        executor = process_pool(num_processes, init_compress_process, (self._cancel_event,))
+        queued = iter(jobs)
+        running = {}
+
+        def submit_next():
+            job = next(queued, None)
+            if job is not None:
+                i, config = job
+                self.file_started.emit(i, os.path.basename(config.input_path))
+                running[executor.submit(compress_in_process, config)] = (i, config.input_path)
+
+        try:
+            for _ in range(num_processes):
+                submit_next()
+            # cancel() sets the shared event, so running files return early
+            # and this wait never outlasts a cancellation by much
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i, path = running.pop(future)
+                    try:
+                        file_result = self._file_result(path, future.result())
+                    except Exception as e:
+                        file_result = BatchFileResult(path=path, success=False, error_message=str(e))
+                    if self._cancelled:
+                        return
+                    self._record(i, file_result, batch_result)
+                    submit_next()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _file_result(path: str, result: CompressionResult) -> BatchFileResult:
+        return BatchFileResult(
+            path=path,
+            success=result.success,
+            original_size=result.original_size,
+            compressed_size=result.compressed_size,
+            output_path=result.output_path if result.success else "",
+            error_message=result.error_message,
+        )
+
+    def _record(self, index: int, file_result: BatchFileResult,
+                batch_result: BatchCompressResult):
+        self.file_finished.emit(index, file_result)
+        batch_result.file_results.append(file_result)
+        if file_result.success:
+            batch_result.succeeded += 1
+            batch_result.total_original_size += file_result.original_size
+            batch_result.total_compressed_size += file_result.compressed_size
+        else:
+            batch_result.failed += 1
+
+        completed = len(batch_result.file_results)
+        total = batch_result.total_files
+        overall_pct = int(completed / total * 100)
+        self.progress.emit(
+            overall_pct, 100,
+            f"Completed {completed}/{total} files",
+        )
+
     def cancel(self):
         self._cancelled = True
-
-    def _on_file_progress(self, file_index: int, step: int, total: int, message: str):
-        pass  # Per-file progress is not surfaced to overall progress bar
+        if self._cancel_event is not None:
+            self._cancel_event.set()
 
     def _is_cancelled(self) -> bool:
         return self._cancelled
@@ -2,12 +2,12 @@
 
 from PyQt6.QtCore import QThread, pyqtSignal
 from core.compressor import PDFCompressor, CompressionConfig, CompressionResult
+from workers.progress import LatestProgressMixin
 
 
-class CompressWorker(QThread):
+class CompressWorker(LatestProgressMixin, QThread):
     """Worker thread for PDF compression."""
 
-    progress = pyqtSignal(int, int, str)
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
 
@@ -33,9 +33,5 @@ class CompressWorker(QThread):
     def cancel(self):
         self._cancelled = True
 
-    def _on_progress(self, step: int, total: int, message: str):
-        if not self._cancelled:
-            self.progress.emit(step, total, message)
-
     def _is_cancelled(self) -> bool:
         return self._cancelled
@@ -4,12 +4,12 @@ from PyQt6.QtCore import QThread, pyqtSignal
 from typing import List
 
 from core.image_to_pdf import ImageToPdfConverter, ImageToPdfResult, PageOrientation
+from workers.progress import LatestProgressMixin
 
 
-class ImageToPdfWorker(QThread):
+class ImageToPdfWorker(LatestProgressMixin, QThread):
     """Runs Image-to-PDF conversion in a background thread."""
 
-    progress = pyqtSignal(int, int, str)
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
 
@@ -45,9 +45,5 @@ class ImageToPdfWorker(QThread):
     def cancel(self):
         self._cancelled = True
 
-    def _on_progress(self, step: int, total: int, message: str):
-        if not self._cancelled:
-            self.progress.emit(step, total, message)
-
     def _is_cancelled(self) -> bool:
         return self._cancelled
@@ -0,0 +1,26 @@
+"""Background worker for LibreOffice detection."""
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from core.utils import detect_libreoffice, LibreOfficeInfo
+
+
+class LibreOfficeDetectWorker(QThread):
+    """Runs detect_libreoffice in a background thread.
+
+    Detection launches `soffice --version`, which can take a noticeable
+    moment on a cold start, so it must not run on the GUI thread.
+    """
+
+    detected = pyqtSignal(object)  # LibreOfficeInfo
+
+    def __init__(self, refresh: bool = False, parent=None):
+        super().__init__(parent)
+        self._refresh = refresh
+
+    def run(self):
+        try:
+            info = detect_libreoffice(refresh=self._refresh)
+        except Exception:
+            info = LibreOfficeInfo(found=False)
+        self.detected.emit(info)
@@ -4,12 +4,12 @@ from PyQt6.QtCore import QThread, pyqtSignal
 from typing import List
 
 from core.merger import PDFMerger, MergeResult
+from workers.progress import LatestProgressMixin
 
 
-class MergeWorker(QThread):
+class MergeWorker(LatestProgressMixin, QThread):
     """Runs PDF merge in a background thread."""
 
-    progress = pyqtSignal(int, int, str)
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
 
@@ -37,9 +37,5 @@ class MergeWorker(QThread):
     def cancel(self):
         self._cancelled = True
 
-    def _on_progress(self, step: int, total: int, message: str):
-        if not self._cancelled:
-            self.progress.emit(step, total, message)
-
     def _is_cancelled(self) -> bool:
         return self._cancelled
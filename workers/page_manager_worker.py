@@ -1,17 +1,19 @@
 """Background workers for Page Manager thumbnail rendering and saving."""
 
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from PIL import Image
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from core.page_manager import PageManager, PageSource
+from workers.progress import LatestProgressMixin
 
 
 class ThumbnailWorker(QThread):
     """Renders PDF page thumbnails in background."""
 
-    thumbnail_ready = pyqtSignal(int, object)  # (page_index, PIL.Image)
+    # (page_index, PIL.Image, page width, page height in points)
+    thumbnail_ready = pyqtSignal(int, object, float, float)
     finished = pyqtSignal()
     error = pyqtSignal(str)
 
@@ -20,10 +22,14 @@ class ThumbnailWorker(QThread):
         self._pdf_path = pdf_path
         self._thumb_width = thumb_width
         self._cancelled = False
+        self._page_sizes: List[Tuple[float, float]] = []
 
     def run(self):
         try:
             manager = PageManager()
+            # Sent along with each thumbnail so the receiving widget never
+            # has to open the PDF on the GUI thread to size a page
+            self._page_sizes = manager.page_sizes(self._pdf_path)
             manager.render_thumbnails(
                 self._pdf_path,
                 thumb_width=self._thumb_width,
@@ -38,7 +44,8 @@ class ThumbnailWorker(QThread):
 
     def _on_thumbnail(self, index: int, img: Image.Image):
         if not self._cancelled:
-            self.thumbnail_ready.emit(index, img)
+            width, height = self._page_sizes[index]
+            self.thumbnail_ready.emit(index, img, width, height)
 
     def cancel(self):
         self._cancelled = True
@@ -97,10 +104,9 @@ class SaveWorker(QThread):
         return self._cancelled
 
 
-class EnhancedSaveWorker(QThread):
+class EnhancedSaveWorker(LatestProgressMixin, QThread):
     """Builds a new PDF from a list of PageSource objects with annotations."""
 
-    progress = pyqtSignal(int, int, str)
     finished = pyqtSignal(object)  # PageManagerResult
     error = pyqtSignal(str)
 
@@ -128,10 +134,6 @@ class EnhancedSaveWorker(QThread):
     def cancel(self):
         self._cancelled = True
 
-    def _on_progress(self, step: int, total: int, message: str):
-        if not self._cancelled:
-            self.progress.emit(step, total, message)
-
     def _is_cancelled(self) -> bool:
         return self._cancelled
 
@@ -4,12 +4,12 @@ from PyQt6.QtCore import QThread, pyqtSignal
 from typing import List, Optional
 
 from core.pdf_to_image import PDFToImageConverter, PDFToImageResult, ImageFormat
+from workers.progress import LatestProgressMixin
 
 
-class PDFToImageWorker(QThread):
+class PDFToImageWorker(LatestProgressMixin, QThread):
     """Runs PDF-to-Image conversion in a background thread."""
 
-    progress = pyqtSignal(int, int, str)
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
 
@@ -21,6 +21,7 @@ class PDFToImageWorker(QThread):
         image_format: ImageFormat = ImageFormat.PNG,
         dpi: int = 300,
         jpeg_quality: int = 90,
+        workers: Optional[int] = None,
         parent=None,
     ):
         super().__init__(parent)
@@ -30,6 +31,7 @@ class PDFToImageWorker(QThread):
         self._image_format = image_format
         self._dpi = dpi
         self._jpeg_quality = jpeg_quality
+        self._workers = workers
         self._cancelled = False
         self._converter = PDFToImageConverter()
 
@@ -42,6 +44,7 @@ class PDFToImageWorker(QThread):
                 image_format=self._image_format,
                 dpi=self._dpi,
                 jpeg_quality=self._jpeg_quality,
+                workers=self._workers,
                 on_progress=self._on_progress,
                 is_cancelled=self._is_cancelled,
             )
@@ -54,9 +57,5 @@ class PDFToImageWorker(QThread):
     def cancel(self):
         self._cancelled = True
 
-    def _on_progress(self, step: int, total: int, message: str):
-        if not self._cancelled:
-            self.progress.emit(step, total, message)
-
     def _is_cancelled(self) -> bool:
         return self._cancelled
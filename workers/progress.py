@@ -0,0 +1,21 @@
+"""Progress reporting shared by the background workers."""
+
+from typing import Optional, Tuple
+
+
+class LatestProgressMixin:
+    """Keeps only the most recent progress report for the UI to poll.
+
+    Engines report every page. Storing a tuple is a single atomic reference
+    swap, so per-page reporting costs no queued signal or event allocation;
+    ProgressWidget.track() reads it on a timer.
+    """
+
+    _latest_progress: Optional[Tuple[int, int, str]] = None
+
+    def latest_progress(self) -> Optional[Tuple[int, int, str]]:
+        """Most recent (step, total, message), or None before the first report."""
+        return self._latest_progress
+
+    def _on_progress(self, step: int, total: int, message: str):
+        self._latest_progress = (step, total, message)
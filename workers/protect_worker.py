@@ -3,12 +3,12 @@
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from core.protector import PDFProtector, ProtectConfig, UnlockConfig, ProtectResult
+from workers.progress import LatestProgressMixin
 
 
-class ProtectWorker(QThread):
+class ProtectWorker(LatestProgressMixin, QThread):
     """Runs PDF protect/unlock in a background thread."""
 
-    progress = pyqtSignal(int, int, str)
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
 
@@ -52,9 +52,5 @@ class ProtectWorker(QThread):
     def cancel(self):
         self._cancelled = True
 
-    def _on_progress(self, step: int, total: int, message: str):
-        if not self._cancelled:
-            self.progress.emit(step, total, message)
-
     def _is_cancelled(self) -> bool:
         return self._cancelled
@@ -4,12 +4,12 @@ from PyQt6.QtCore import QThread, pyqtSignal
 from typing import List
 
 from core.splitter import PDFSplitter, SplitResult
+from workers.progress import LatestProgressMixin
 
 
-class SplitWorker(QThread):
+class SplitWorker(LatestProgressMixin, QThread):
     """Runs PDF split/extract in a background thread."""
 
-    progress = pyqtSignal(int, int, str)
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
 
@@ -58,9 +58,5 @@ class SplitWorker(QThread):
     def cancel(self):
         self._cancelled = True
 
-    def _on_progress(self, step: int, total: int, message: str):
-        if not self._cancelled:
-            self.progress.emit(step, total, message)
-
     def _is_cancelled(self) -> bool:
         return self._cancelled
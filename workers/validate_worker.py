@@ -0,0 +1,27 @@
+"""Background worker for PDF validation."""
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from core.utils import validate_pdf, ValidationResult
+
+
+class ValidateWorker(QThread):
+    """Runs validate_pdf in a background thread so large files don't block the UI.
+
+    Each run is tagged with a generation number; the owning widget ignores
+    results whose generation is no longer current (e.g. a newer file was dropped).
+    """
+
+    validated = pyqtSignal(int, str, object)  # (generation, file_path, ValidationResult)
+
+    def __init__(self, file_path: str, generation: int, parent=None):
+        super().__init__(parent)
+        self._file_path = file_path
+        self._generation = generation
+
+    def run(self):
+        try:
+            result = validate_pdf(self._file_path)
+        except Exception as e:
+            result = ValidationResult(False, str(e))
+        self.validated.emit(self._generation, self._file_path, result)
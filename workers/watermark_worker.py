@@ -1,16 +1,18 @@
-"""Background worker for PDF watermarking."""
+"""Background workers for PDF watermarking and its live preview."""
+
+from typing import Optional
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from core.watermark import (
     PDFWatermarker, TextWatermarkConfig, ImageWatermarkConfig, WatermarkResult,
 )
+from workers.progress import LatestProgressMixin
 
 
-class WatermarkWorker(QThread):
+class WatermarkWorker(LatestProgressMixin, QThread):
     """Runs PDF watermarking in a background thread."""
 
-    progress = pyqtSignal(int, int, str)
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
 
@@ -54,9 +56,63 @@ class WatermarkWorker(QThread):
     def cancel(self):
         self._cancelled = True
 
-    def _on_progress(self, step: int, total: int, message: str):
-        if not self._cancelled:
-            self.progress.emit(step, total, message)
-
     def _is_cancelled(self) -> bool:
         return self._cancelled
+
+
+class PreviewSourceWorker(QThread):
+    """Loads the inputs of the image watermark preview in a background thread.
+
+    Opening a large PDF and rasterizing its first page, or decoding a big
+    logo, can take long enough to stall the UI. Either input may be skipped
+    (None) when the widget already has it cached. A decoded image wider than
+    image_max_width is reduced to it. Each run carries a
+    generation number; the widget ignores results that are no longer current.
+    """
+
+    # (generation, pdf_path, width, page image or None, zoom,
+    #  image_path, decoded watermark or None)
+    loaded = pyqtSignal(int, str, int, object, float, str, object)
+    error = pyqtSignal(int, str)
+
+    def __init__(
+        self,
+        generation: int,
+        pdf_path: Optional[str],
+        width: int,
+        image_path: Optional[str],
+        image_max_width: int = 0,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._generation = generation
+        self._pdf_path = pdf_path
+        self._width = width
+        self._image_path = image_path
+        self._image_max_width = image_max_width
+
+    def run(self):
+        try:
+            base, zoom = None, 0.0
+            if self._pdf_path:
+                base, zoom = PDFWatermarker.render_preview_page(self._pdf_path, self._width)
+            wm = None
+            if self._image_path:
+                from PIL import Image as PILImage
+                img = PILImage.open(self._image_path)
+                max_width = self._image_max_width
+                if 0 < max_width < img.width:
+                    # JPEGs then decode at 1/2, 1/4 or 1/8 scale, never below
+                    # max_width; other formats ignore the hint
+                    img.draft(None, (max_width, max(1, img.height * max_width // img.width)))
+                wm = img.convert("RGBA")
+                # The preview never draws the watermark wider than this, so
+                # every later resize can start from the smaller copy
+                if 0 < max_width < wm.width:
+                    wm.thumbnail((max_width, wm.height), PILImage.LANCZOS)
+            self.loaded.emit(
+                self._generation, self._pdf_path or "", self._width, base, zoom,
+                self._image_path or "", wm,
+            )
+        except Exception as e:
+            self.error.emit(self._generation, str(e))